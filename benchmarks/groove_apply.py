@@ -0,0 +1,91 @@
+"""Groove application benchmark.
+
+Times ``apply_groove`` over a bar-sized step dict, the way a looped pattern
+calls it once per cycle.  Reports the warm path (the pulse remap already
+cached, as on every cycle after the first) and the cold path (cache cleared
+before each call).
+
+Usage:
+    python benchmarks/groove_apply.py [--bars N] [--grid GRID] [--repeats N]
+                                      [--no-velocities]
+
+Options:
+    --bars N            Bars of notes in the step dict (default: 4)
+    --grid GRID         Note spacing in beats (default: 0.25 — 16ths)
+    --repeats N         Calls per measurement (default: 2000)
+    --no-velocities     Use a timing-only groove (no velocity scaling)
+"""
+
+import argparse
+import timeit
+import typing
+
+import subsequence.constants
+import subsequence.groove
+import subsequence.pattern
+
+# ---------------------------------------------------------------------------
+
+PPQN          = subsequence.constants.MIDI_QUARTER_NOTE
+BEATS_PER_BAR = 4
+
+
+def _make_steps (bars: int, grid: float) -> typing.Dict[int, subsequence.pattern.Step]:
+
+	"""One note on every grid line for *bars* bars."""
+
+	spacing = grid * PPQN
+	count = int(bars * BEATS_PER_BAR / grid)
+
+	return {
+		int(round(index * spacing)): subsequence.pattern.Step(notes=[
+			subsequence.pattern.Note(pitch=60, velocity=100, duration=int(spacing), channel=0)
+		])
+		for index in range(count)
+	}
+
+
+def _time_per_call (call: typing.Callable[[], object], repeats: int) -> float:
+
+	"""Best-of-five mean seconds per call."""
+
+	return min(timeit.repeat(call, number=repeats, repeat=5)) / repeats
+
+
+def main () -> None:
+
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument("--bars",          type=int,   default=4,    help="Bars of notes (default: 4)")
+	parser.add_argument("--grid",          type=float, default=0.25, help="Note spacing in beats (default: 0.25)")
+	parser.add_argument("--repeats",       type=int,   default=2000, help="Calls per measurement (default: 2000)")
+	parser.add_argument("--no-velocities", action="store_true",      help="Timing-only groove")
+	args = parser.parse_args()
+
+	steps = _make_steps(args.bars, args.grid)
+	groove = subsequence.groove.Groove(
+		offsets = [0.0, 0.035],
+		grid = args.grid,
+		velocities = None if args.no_velocities else [1.0, 0.8],
+	)
+
+	def _warm () -> object:
+		return subsequence.groove.apply_groove(steps, groove)
+
+	def _cold () -> object:
+		subsequence.groove._groove_remap.cache_clear()
+		return subsequence.groove.apply_groove(steps, groove)
+
+	warm = _time_per_call(_warm, args.repeats)
+	cold = _time_per_call(_cold, args.repeats)
+
+	print(f"\nGroove Benchmark — {len(steps)} notes ({args.bars} bars, grid {args.grid:g})")
+	print(f"{'─' * 62}")
+	print(f"  Velocity scaling: {'off' if args.no_velocities else 'on'}")
+	print(f"  Warm (cached)   : {warm * 1e6:>8.1f} μs/call  ({warm * 1e6 / len(steps):.2f} μs/note)")
+	print(f"  Cold (uncached) : {cold * 1e6:>8.1f} μs/call  ({cold * 1e6 / len(steps):.2f} μs/note)")
+	print(f"{'─' * 62}")
+	print()
+
+
+if __name__ == "__main__":
+	main()
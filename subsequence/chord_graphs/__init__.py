@@ -3,6 +3,7 @@ Chord graph builders for different harmonic transition models.
 """
 
 import abc
+import functools
 import typing
 
 import subsequence.chords
@@ -77,6 +78,18 @@ def _major_key_gravity_sets (key_name: str) -> typing.Tuple[typing.Set[subsequen
 
 	"""Return diatonic and functional chord sets for a major key."""
 
+	# Fresh sets per call (callers own them); the chords come from a
+	# per-key memo so each HarmonicState skips rebuilding eleven Chords.
+	diatonic, function_chords = _major_key_gravity_frozensets(key_name)
+
+	return set(diatonic), set(function_chords)
+
+
+@functools.lru_cache(maxsize=None)
+def _major_key_gravity_frozensets (key_name: str) -> typing.Tuple[typing.FrozenSet[subsequence.chords.Chord], typing.FrozenSet[subsequence.chords.Chord]]:
+
+	"""Build the major-key gravity sets once per key name."""
+
 	key_pc = validate_key_name(key_name)
 	scale_pcs = subsequence.intervals.scale_pitch_classes(key_pc, "ionian")
 
@@ -97,4 +110,4 @@ def _major_key_gravity_sets (key_name: str) -> typing.Tuple[typing.Set[subsequen
 	function_chords.add(dominant_7th)
 	diatonic.add(dominant_7th)
 
-	return diatonic, function_chords
+	return frozenset(diatonic), frozenset(function_chords)
@@ -61,6 +61,11 @@ PC_TO_NOTE_NAME: typing.List[str] = [
 	"B",
 ]
 
+# Shortest signed step for each upward pitch-class interval, indexed by
+# (to_pc - from_pc) % 12: 0..6 stay as they are (a tritone counts as +6),
+# 7..11 fold to -5..-1.
+SIGNED_PC_STEP: typing.Tuple[int, ...] = tuple(step - 12 if step > 6 else step for step in range(12))
+
 
 def key_name_to_pc (key_name: str) -> int:
 
@@ -120,7 +125,12 @@ CHORD_SUFFIX: typing.Dict[str, str] = {
 }
 
 
-@dataclasses.dataclass(frozen=True)
+# Interned chords, one per (class, root_pc, quality).  Only registered
+# qualities are pooled, so it never holds more than 12 roots × the quality table.
+_CHORD_POOL: typing.Dict[typing.Tuple[type, int, str], "Chord"] = {}
+
+
+@dataclasses.dataclass(frozen=True, slots=True, init=False)
 class Chord:
 
 	"""
@@ -130,6 +140,49 @@ class Chord:
 	root_pc: int
 	quality: str
 
+	# Chords key the transition graphs and gravity sets, so the hash is
+	# computed once here rather than rebuilt from a tuple on every lookup.
+	_hash: int = dataclasses.field(init=False, repr=False, compare=False)
+
+
+	def __new__ (cls, root_pc: int, quality: str) -> "Chord":
+
+		# Interned: equal chords are the same object, so graph and gravity-set
+		# lookups settle on identity before ever calling __eq__.  There is no
+		# generated __init__ — a pooled chord is set up here exactly once and
+		# never re-initialised by a later construction.
+		if not isinstance(root_pc, int) or isinstance(root_pc, bool):
+			raise ValueError(f"root_pc must be a whole-number pitch class, not {root_pc!r}")
+		if not isinstance(quality, str):
+			raise ValueError(f"quality must be a quality name, not {quality!r}")
+
+		root_pc %= 12
+		key = (cls, root_pc, quality)
+		chord = _CHORD_POOL.get(key)
+
+		if chord is None:
+			chord = object.__new__(cls)
+			object.__setattr__(chord, "root_pc", root_pc)
+			object.__setattr__(chord, "quality", quality)
+			object.__setattr__(chord, "_hash", hash((root_pc, quality)))
+
+			if quality in CHORD_INTERVALS:
+				_CHORD_POOL[key] = chord
+
+		return chord
+
+
+	def __hash__ (self) -> int:
+
+		return self._hash
+
+
+	def __reduce__ (self) -> typing.Tuple[typing.Any, ...]:
+
+		# Rebuild through __init__ so the cached hash is recomputed; string
+		# hashes differ between processes, so a pickled one would be wrong.
+		return (type(self), (self.root_pc, self.quality))
+
 
 	def intervals (self) -> typing.List[int]:
 
@@ -173,9 +226,7 @@ class Chord:
 
 		# Find the MIDI note for self.root_pc that is closest to the requested root.
 		# This handles octaves automatically.
-		offset = (self.root_pc - root) % 12
-		if offset > 6:
-			offset -= 12
+		offset = SIGNED_PC_STEP[(self.root_pc - root) % 12]
 
 		effective_root = root + offset
 
@@ -4926,14 +4926,17 @@ class Composition:
 			primary = (device if device is not None else 0, resolved_channel)
 		resolved_mirrors = self._resolve_mirrors(mirrors, primary=primary)
 
-		wants_chord = any(_fn_has_parameter(fn, "chord") for fn in builder_fns)
+		# Inspect each signature once here, not on every rebuild — the merged
+		# builder runs every cycle, and inspect.signature() is not cheap.
+		chord_flags = [(fn, _fn_has_parameter(fn, "chord")) for fn in builder_fns]
+		wants_chord = any(fn_wants_chord for _, fn_wants_chord in chord_flags)
 
 		if wants_chord:
 
 			def merged_builder (p: subsequence.pattern_builder.PatternBuilder, chord: _InjectedChord) -> None:
 
-				for fn in builder_fns:
-					if _fn_has_parameter(fn, "chord"):
+				for fn, fn_wants_chord in chord_flags:
+					if fn_wants_chord:
 						fn(p, chord)
 					else:
 						fn(p)
@@ -31,7 +31,7 @@ logger = logging.getLogger(__name__)
 _AT_END_CHOICES: typing.FrozenSet[str] = frozenset({"stop", "hold", "loop"})
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class SectionInfo:
 
 	"""
@@ -56,6 +56,9 @@ class SectionInfo:
 			key, then composition key — supplies it).
 		scale: The section's scale/mode override, or ``None`` (falls back
 			through the form scale to the composition scale).
+		progress: How far through this section we are (0.0 to ~1.0).
+		first_bar: True on the first bar of the section.
+		last_bar: True on the last bar of the section.
 
 	Example:
 		```python
@@ -87,29 +90,19 @@ class SectionInfo:
 	key: typing.Optional[str] = None
 	scale: typing.Optional[str] = None
 
-	@property
-	def progress (self) -> float:
-
-		"""Return how far through this section we are (0.0 to ~1.0)."""
-
-		if self.bars <= 0:
-			return 0.0
-
-		return self.bar / self.bars
-
-	@property
-	def first_bar (self) -> bool:
-
-		"""Return True if this is the first bar of the section."""
-
-		return self.bar == 0
+	# Derived once at construction: a snapshot is read by many builders per
+	# bar, and its inputs can never change afterwards.
+	progress: float = dataclasses.field(init=False)
+	first_bar: bool = dataclasses.field(init=False)
+	last_bar: bool = dataclasses.field(init=False)
 
-	@property
-	def last_bar (self) -> bool:
+	def __post_init__ (self) -> None:
 
-		"""Return True if this is the last bar of the section."""
+		"""Compute the derived position fields from ``bar`` and ``bars``."""
 
-		return self.bar == self.bars - 1
+		object.__setattr__(self, "progress", self.bar / self.bars if self.bars > 0 else 0.0)
+		object.__setattr__(self, "first_bar", self.bar == 0)
+		object.__setattr__(self, "last_bar", self.bar == self.bars - 1)
 
 	@property
 	def ending (self) -> bool:
@@ -205,6 +198,16 @@ class FormState:
 		self._peeked: typing.Optional[subsequence.forms.Section] = None
 		self._peek_exhausted: bool = False
 
+		# get_section_info() is read by every builder on every rebuild, but
+		# only changes when the form moves — cache the snapshot and drop it
+		# whenever advance(), jump_to() or queue_next() touches the state.
+		self._cached_info: typing.Optional[SectionInfo] = None
+
+		# The form's mode never changes after construction, so the section
+		# boundary handler is chosen once here rather than re-dispatched on
+		# every boundary advance() crosses.
+		self._cross_boundary: typing.Callable[[], bool]
+
 		if isinstance(sections, dict):
 			# Graph mode: build a WeightedGraph from the dict.
 			if at_end != "stop":
@@ -241,6 +244,7 @@ class FormState:
 			if start_name not in self._section_bars:
 				raise ValueError(f"Start section '{start_name}' not found in form definition")
 
+			self._cross_boundary = self._cross_boundary_graph
 			self._current = subsequence.forms.Section(name = start_name, bars = self._section_bars[start_name])
 			self._pick_next()
 
@@ -248,6 +252,7 @@ class FormState:
 			# Sequence mode: the timeline is a known, navigable list.
 			elements = sections.sections if isinstance(sections, subsequence.forms.Form) else sections
 			self._sequence = [subsequence.forms._coerce_section(element) for element in elements]
+			self._cross_boundary = self._cross_boundary_sequence
 
 			if self._sequence:
 				self._current = self._sequence[0]
@@ -265,6 +270,7 @@ class FormState:
 				)
 
 			self._iterator = sections
+			self._cross_boundary = self._cross_boundary_generator
 
 			try:
 				self._current = subsequence.forms._coerce_section(next(self._iterator))
@@ -391,6 +397,8 @@ class FormState:
 			ValueError: If the form is a generator, or the name is unknown.
 		"""
 
+		self._cached_info = None
+
 		if self._sequence is not None:
 			self._queued_position = self._find_occurrence(section_name, "queue_next")
 			self._next_section_name = section_name
@@ -417,6 +425,8 @@ class FormState:
 
 		"""Advance one bar, transitioning to the next section when needed, returning True if section changed."""
 
+		self._cached_info = None
+
 		if self._finished:
 
 			# A queued section revives a finished form at the next bar —
@@ -448,72 +458,84 @@ class FormState:
 		assert self._current is not None, "Form state invariant: current should not be None when not finished"
 
 		if self._bar_in_section >= self._current.bars:
+			return self._cross_boundary()
 
-			if self._graph is not None:
-				# Graph mode: consume the pre-decided (or queued) next section.
-				if self._next_section_name is None:
-					# Terminal section — form ends.
-					self._finished = True
-					self._current = None
-					return True
+		return False
 
-				assert self._section_bars is not None
-				next_name = self._next_section_name
-				self._current = subsequence.forms.Section(name = next_name, bars = self._section_bars[next_name])
-				self._section_index += 1
-				self._bar_in_section = 0
-				self._pick_next()
-				return True
+	def _cross_boundary_graph (self) -> bool:
 
-			elif self._sequence is not None:
-				# Sequence mode: a queued jump wins; otherwise the timeline
-				# (with at_end deciding what happens past the last section).
-				if self._queued_position is not None:
-					self._position = self._queued_position
-					self._queued_position = None
-				else:
-					following = self._sequence_next_position()
+		"""Graph mode: consume the pre-decided (or queued) next section."""
 
-					if following is None:
-						if self._at_end == "hold":
-							# The final section repeats (a re-entry: the index
-							# bumps so bound material restarts correctly).
-							self._section_index += 1
-							self._bar_in_section = 0
-							self._pick_next()
-							return True
+		if self._next_section_name is None:
+			# Terminal section — form ends.
+			self._finished = True
+			self._current = None
+			return True
 
-						self._finished = True
-						self._current = None
-						return True
+		assert self._section_bars is not None
+		next_name = self._next_section_name
+		self._current = subsequence.forms.Section(name = next_name, bars = self._section_bars[next_name])
+		self._section_index += 1
+		self._bar_in_section = 0
+		self._pick_next()
+		return True
 
-					self._position = following
+	def _cross_boundary_sequence (self) -> bool:
 
-				self._current = self._sequence[self._position]
-				self._section_index += 1
-				self._bar_in_section = 0
-				self._pick_next()
-				return True
+		"""Sequence mode: a queued jump wins; otherwise follow the timeline.
 
-			else:
-				# Generator mode: consume from the peek buffer.
-				if self._peeked is not None:
-					self._current = self._peeked
-					self._peeked = None
-					self._section_index += 1
-					self._bar_in_section = 0
-					self._peek_iterator()
-					return True
-				elif self._at_end == "hold":
+		``at_end`` decides what happens past the last section.
+		"""
+
+		assert self._sequence is not None
+
+		if self._queued_position is not None:
+			self._position = self._queued_position
+			self._queued_position = None
+		else:
+			following = self._sequence_next_position()
+
+			if following is None:
+				if self._at_end == "hold":
+					# The final section repeats (a re-entry: the index
+					# bumps so bound material restarts correctly).
 					self._section_index += 1
 					self._bar_in_section = 0
-					return True
-				else:
-					self._finished = True
-					self._current = None
+					self._pick_next()
 					return True
 
-		return False
+				self._finished = True
+				self._current = None
+				return True
+
+			self._position = following
+
+		self._current = self._sequence[self._position]
+		self._section_index += 1
+		self._bar_in_section = 0
+		self._pick_next()
+		return True
+
+	def _cross_boundary_generator (self) -> bool:
+
+		"""Generator mode: consume from the peek buffer."""
+
+		if self._peeked is not None:
+			self._current = self._peeked
+			self._peeked = None
+			self._section_index += 1
+			self._bar_in_section = 0
+			self._peek_iterator()
+			return True
+
+		if self._at_end == "hold":
+			self._section_index += 1
+			self._bar_in_section = 0
+			return True
+
+		self._finished = True
+		self._current = None
+		return True
 
 	def get_section_info (self) -> typing.Optional[SectionInfo]:
 
@@ -522,16 +544,19 @@ class FormState:
 		if self._finished or self._current is None:
 			return None
 
-		return SectionInfo(
-			name = self._current.name,
-			bar = self._bar_in_section,
-			bars = self._current.bars,
-			index = self._section_index,
-			next_section = self._next_section_name,
-			energy = self._current.energy,
-			key = self._current.key,
-			scale = self._current.scale,
-		)
+		if self._cached_info is None:
+			self._cached_info = SectionInfo(
+				name = self._current.name,
+				bar = self._bar_in_section,
+				bars = self._current.bars,
+				index = self._section_index,
+				next_section = self._next_section_name,
+				energy = self._current.energy,
+				key = self._current.key,
+				scale = self._current.scale,
+			)
+
+		return self._cached_info
 
 	def section_info_at_bar (self, bar: int) -> typing.Optional[SectionInfo]:
 
@@ -633,6 +658,8 @@ class FormState:
 			composition.form_jump("chorus")   # via Composition helper
 		"""
 
+		self._cached_info = None
+
 		if self._sequence is not None:
 			self._position = self._find_occurrence(section_name, "jump_to")
 			self._current = self._sequence[self._position]
@@ -8,6 +8,7 @@ or from an Ableton ``.agr`` file, then apply it with ``p.groove(template)``.
 from __future__ import annotations
 
 import dataclasses
+import functools
 import typing
 import xml.etree.ElementTree
 
@@ -129,7 +130,33 @@ class Groove:
 				infers it from the clip, assuming one note per cell.
 		"""
 
-		tree = xml.etree.ElementTree.parse(path)
+		with open(path, "rb") as stream:
+			return Groove._parse_agr(stream, grid, str(path))
+
+	@staticmethod
+	def from_agr_stream (stream: typing.IO[typing.Any], grid: typing.Optional[float] = None) -> "Groove":
+
+		"""
+		Import an Ableton .agr groove from an open file-like object.
+
+		Identical to :meth:`from_agr`, for groove data that is not on disk
+		(downloaded, embedded, or generated). Accepts text or binary streams.
+
+		Parameters:
+			stream: A readable file-like object holding the .agr XML.
+			grid: Grid size in beats, as for :meth:`from_agr`.
+		"""
+
+		return Groove._parse_agr(stream, grid, str(getattr(stream, "name", "<stream>")))
+
+	@staticmethod
+	def _parse_agr (stream: typing.IO[typing.Any], grid: typing.Optional[float], path: str) -> "Groove":
+
+		"""
+		Parse .agr XML from *stream*; *path* names the source in errors.
+		"""
+
+		tree = xml.etree.ElementTree.parse(stream)
 		root = tree.getroot()
 
 		# Find the MIDI clip
@@ -163,19 +190,15 @@ class Groove:
 		if not events:
 			raise ValueError(f"No MidiNoteEvent elements found in {path}")
 
-		times: typing.List[float] = []
-		velocities_raw: typing.List[float] = []
-		for event in events:
-			times.append(float(event.get("Time", "0")))
-			velocities_raw.append(float(event.get("Velocity", "127")))
-
-		# Sort as PAIRS - sorting times alone desynced each offset from its
-		# note's velocity whenever the XML listed events out of time order.
-		paired = sorted(zip(times, velocities_raw))
-		times = [t for t, _ in paired]
-		velocities_raw = [v for _, v in paired]
+		# Read each event once as a (time, velocity) pair and sort as PAIRS -
+		# sorting times alone desynced each offset from its note's velocity
+		# whenever the XML listed events out of time order.
+		paired = sorted(
+			(float(event.get("Time", "0")), float(event.get("Velocity", "127")))
+			for event in events
+		)
 
-		note_count = len(times)
+		note_count = len(paired)
 
 		# Infer grid from clip length and note count — valid only for the
 		# one-note-per-cell clip shape (see docstring); grid= overrides.
@@ -193,7 +216,7 @@ class Groove:
 		slot_offsets = [0.0] * slot_count
 		slot_velocities: typing.List[typing.Optional[float]] = [None] * slot_count
 
-		for time, velocity in zip(times, velocities_raw):
+		for time, velocity in paired:
 
 			slot = int(round(time / grid))
 
@@ -257,67 +280,141 @@ def apply_groove (
 	if not 0.0 <= strength <= 1.0:
 		raise ValueError("strength must be between 0.0 and 1.0")
 
-	grid_pulses = groove.grid * pulses_per_quarter
-	if grid_pulses <= 0:
+	# A disabled groove (strength 0.0) is a no-op by definition; skip the
+	# remap rather than computing one that moves nothing.
+	if strength == 0.0:
 		return dict(steps)
 
-	half_grid = grid_pulses / 2.0
-	num_offsets = len(groove.offsets)
-	num_velocities = len(groove.velocities) if groove.velocities else 0
+	if groove.grid * pulses_per_quarter <= 0:
+		return dict(steps)
+
+	# A looped pattern re-grooves the same pulse layout every cycle, so the
+	# slot arithmetic is memoised on the layout and the groove's values
+	# (snapshotted as tuples, so editing a Groove in place is still seen).
+	remap = _groove_remap(
+		tuple(steps),
+		tuple(groove.offsets),
+		tuple(groove.velocities) if groove.velocities else None,
+		groove.grid,
+		pulses_per_quarter,
+		strength,
+	)
+
+	# Nothing moves and nothing is rescaled (a straight groove over a
+	# quantised pattern, say) — skip rebuilding every Step.
+	if remap is None:
+		return dict(steps)
 
 	new_steps: typing.Dict[int, subsequence.pattern.Step] = {}
 
-	for old_pulse, step in steps.items():
+	for (new_pulse, vel_scale), step in zip(remap, steps.values()):
+
+		notes = step.notes if vel_scale == 1.0 else _scale_step_velocity(step, vel_scale).notes
+		landed = new_steps.get(new_pulse)
+
+		# One lookup, and one list copy per destination pulse; the note
+		# objects themselves are shared, never the caller's Step lists.
+		if landed is None:
+			new_steps[new_pulse] = subsequence.pattern.Step(notes=list(notes))
+		else:
+			landed.notes.extend(notes)
+
+	return new_steps
+
+
+@functools.lru_cache(maxsize=256)
+def _groove_remap (
+	pulses: typing.Tuple[int, ...],
+	offsets: typing.Tuple[float, ...],
+	velocities: typing.Optional[typing.Tuple[float, ...]],
+	grid: float,
+	pulses_per_quarter: int,
+	strength: float,
+) -> typing.Optional[typing.Tuple[typing.Tuple[int, float], ...]]:
+
+	"""
+	Return ``(new_pulse, velocity_scale)`` for each pulse, in input order.
+
+	Returns ``None`` when the groove would leave every pulse where it is with
+	a unit velocity scale.
+	"""
+
+	# Loop invariants, hoisted: the capture window, each slot's offset in
+	# pulses, and the slot counts.
+	grid_pulses = grid * pulses_per_quarter
+	window = grid_pulses / 4.0
+	offset_pulses = tuple(offset * pulses_per_quarter for offset in offsets)
+	num_offsets = len(offset_pulses)
+	num_velocities = len(velocities) if velocities else 0
+
+	# Common grids land on whole pulses (a 16th at 24 PPQN is 6), so the
+	# nearest grid line comes from one integer divmod; fractional grids
+	# fall back to float division.  Exact halfway points sit outside the
+	# window either way, so the two agree on every grooved note.
+	integral_grid = int(grid_pulses) if float(grid_pulses).is_integer() else 0
+
+	remap: typing.List[typing.Tuple[int, float]] = []
+
+	for old_pulse in pulses:
 
 		# Find nearest grid position
-		grid_index = round(old_pulse / grid_pulses)
-		ideal_pulse = grid_index * grid_pulses
+		distance: float
+		if integral_grid:
+			grid_index, distance = divmod(old_pulse, integral_grid)
+			if distance * 2 > integral_grid:
+				grid_index += 1
+				distance = integral_grid - distance
+			ideal_pulse: float = grid_index * integral_grid
+		else:
+			grid_index = round(old_pulse / grid_pulses)
+			ideal_pulse = grid_index * grid_pulses
+			distance = abs(old_pulse - ideal_pulse)
 
 		# Only groove notes that sit close to a grid position; notes deliberately
 		# placed between grid lines (flams, pushes) keep both their timing AND
-		# velocity.  The window is ±25% of a cell (half_grid * 0.5) — narrow on
-		# purpose, so off-grid expression survives a quantised groove.
-		if abs(old_pulse - ideal_pulse) > half_grid * 0.5:
-			new_pulse = old_pulse
-		else:
-			slot = grid_index % num_offsets
+		# velocity.  The window is ±25% of a cell — narrow on purpose, so
+		# off-grid expression survives a quantised groove.
+		if distance > window:
+			remap.append((old_pulse, 1.0))
+			continue
 
-			# Blend from the note's OWN pulse toward the groove target so
-			# strength=0.0 truly leaves timing untouched.  (Blending from
-			# ideal_pulse quantised away in-window micro-timing — e.g. from
-			# randomize() — at every strength, including 0.)
-			groove_target = ideal_pulse + groove.offsets[slot] * pulses_per_quarter
-			new_pulse = int(round(old_pulse + (groove_target - old_pulse) * strength))
-			new_pulse = max(0, new_pulse)
+		# Blend from the note's OWN pulse toward the groove target so
+		# strength=0.0 truly leaves timing untouched.  (Blending from
+		# ideal_pulse quantised away in-window micro-timing — e.g. from
+		# randomize() — at every strength, including 0.)
+		groove_target = ideal_pulse + offset_pulses[grid_index % num_offsets]
+		new_pulse = max(0, int(round(old_pulse + (groove_target - old_pulse) * strength)))
 
-			# Velocity scaling applies only to grooved (on-grid) notes, for the
-			# same reason — an off-grid note shouldn't pick up a slot's accent.
-			if groove.velocities and num_velocities > 0:
-				vel_slot = grid_index % num_velocities
-				# Blend between 1.0 (no effect) and the groove's scale (full effect)
-				vel_scale = 1.0 + (groove.velocities[vel_slot] - 1.0) * strength
-				step = _scale_step_velocity(step, vel_scale)
+		# Velocity scaling applies only to grooved (on-grid) notes, for the
+		# same reason — an off-grid note shouldn't pick up a slot's accent.
+		# Blend between 1.0 (no effect) and the groove's scale (full effect).
+		vel_scale = 1.0
+		if velocities:
+			vel_scale = 1.0 + (velocities[grid_index % num_velocities] - 1.0) * strength
 
-		if new_pulse not in new_steps:
-			new_steps[new_pulse] = subsequence.pattern.Step()
+		remap.append((new_pulse, vel_scale))
 
-		new_steps[new_pulse].notes.extend(step.notes)
+	if all(new_pulse == old_pulse and vel_scale == 1.0 for old_pulse, (new_pulse, vel_scale) in zip(pulses, remap)):
+		return None
 
-	return new_steps
+	return tuple(remap)
 
 
 def _scale_step_velocity (step: "subsequence.pattern.Step", scale: float) -> "subsequence.pattern.Step":
 
 	"""
 	Return a copy of the step with scaled velocities.
+
+	A unit scale returns the step itself — nothing would change, so there is
+	nothing to copy.
 	"""
 
+	if scale == 1.0:
+		return step
+
 	import subsequence.pattern
 
-	new_notes = []
-	for note in step.notes:
-		new_notes.append(dataclasses.replace(
-			note,
-			velocity=max(1, min(127, int(round(note.velocity * scale))))
-		))
-	return subsequence.pattern.Step(notes=new_notes)
+	return subsequence.pattern.Step(notes=[
+		dataclasses.replace(note, velocity=min(127, max(1, round(note.velocity * scale))))
+		for note in step.notes
+	])
@@ -1,3 +1,4 @@
+import functools
 import random
 import typing
 
@@ -79,6 +80,120 @@ def _resolve_graph_style (
 
 
 
+@functools.lru_cache(maxsize=64)
+def _build_graph_style (
+	style: str,
+	include_dominant_7th: bool,
+	minor_turnaround_weight: float,
+	key_name: str
+) -> typing.Tuple[
+	subsequence.weighted_graph.WeightedGraph[subsequence.chords.Chord],
+	subsequence.chords.Chord,
+	typing.FrozenSet[subsequence.chords.Chord],
+	typing.FrozenSet[subsequence.chords.Chord],
+]:
+
+	"""Build a built-in style's graph, tonic and gravity sets once per argument set.
+
+	The returned graph is shared — callers must copy it before use.
+	"""
+
+	chord_graph = _resolve_graph_style(style, include_dominant_7th, minor_turnaround_weight)
+	graph, tonic = chord_graph.build(key_name)
+	diatonic, function_chords = chord_graph.gravity_sets(key_name)
+
+	return graph, tonic, frozenset(diatonic), frozenset(function_chords)
+
+
+def _nir_rule_score (prev_step: int, target_step: int, closes: bool) -> float:
+
+	"""
+	Apply the NIR rules to one implication/realization pair of upward
+	pitch-class intervals (0–11), before ``nir_strength`` scaling.
+	"""
+
+	# Interval from Prev -> Source (The "Implication" generator)
+	# Using shortest-path distance in Pitch Class space (see subsequence.chords.SIGNED_PC_STEP)
+	prev_diff = subsequence.chords.SIGNED_PC_STEP[prev_step]
+
+	prev_interval = abs(prev_diff)
+	prev_direction = 1 if prev_diff > 0 else -1 if prev_diff < 0 else 0
+
+	# Interval from Source -> Target (The "Realization")
+	target_diff = subsequence.chords.SIGNED_PC_STEP[target_step]
+
+	target_interval = abs(target_diff)
+	target_direction = 1 if target_diff > 0 else -1 if target_diff < 0 else 0
+
+	score = 1.0
+
+	# --- Rule A: Reversal (Gap Fill) ---
+	# If the previous step was a large leap (> 4 on the 0–6 pitch-class
+	# shortest-path scale, where a tritone is 6), expect a direction change.
+	if prev_interval > 4:
+		# Expect change in direction
+		if target_direction != prev_direction and target_direction != 0:
+			score += 0.5
+
+		# Expect smaller interval (Gap Fill)
+		if target_interval < 4:
+			score += 0.3
+
+	# --- Rule B: Process (Continuation/Inertia) ---
+	# If previous was Small Step (< 3 semitones), expect similarity.
+	elif prev_interval > 0 and prev_interval < 3:
+		# Expect same direction
+		if target_direction == prev_direction:
+			score += 0.4
+
+		# Expect similar size
+		if abs(target_interval - prev_interval) <= 1:
+			score += 0.2
+
+	# --- Rule C: Closure ---
+	# Return to Tonic (Closure) is often implied after tension
+	if closes:
+		score += 0.2
+
+	# --- Rule D: Proximity ---
+	# General preference for small intervals (≤ 3 semitones).
+	if target_interval > 0 and target_interval <= 3:
+		score += 0.3
+
+	return score
+
+
+# Every NIR outcome, evaluated once: the rules see only the two upward
+# intervals and whether the target is the tonic, so 12 × 12 × 2 entries
+# cover all candidates.  Indexed [prev_step * 24 + target_step * 2 + closes].
+_NIR_SCORES: typing.Tuple[float, ...] = tuple(
+	_nir_rule_score(prev_step, target_step, closes)
+	for prev_step in range(12)
+	for target_step in range(12)
+	for closes in (False, True)
+)
+
+
+def _nir_score (prev_root: int, source_root: int, target_root: int, tonic_root: int, nir_strength: float) -> float:
+
+	"""
+	The numeric core of :meth:`HarmonicState._calculate_nir_score`.
+
+	Works on root pitch classes only (plain ints) and reads the rule outcome
+	from ``_NIR_SCORES``, so scoring a candidate is one table lookup.
+	"""
+
+	score = _NIR_SCORES[
+		((source_root - prev_root) % 12) * 24
+		+ ((target_root - source_root) % 12) * 2
+		+ (target_root == tonic_root)
+	]
+
+	# Scale the boost portion by nir_strength (score starts at 1.0, boost is the excess)
+	return 1.0 + (score - 1.0) * nir_strength
+
+
+
 class HarmonicState:
 
 	"""Holds the current chord and key context for the composition."""
@@ -137,13 +252,18 @@ class HarmonicState:
 
 
 		if isinstance(graph_style, str):
-			chord_graph = _resolve_graph_style(graph_style, include_dominant_7th, minor_turnaround_weight)
+			# Built-in styles build deterministically from these four values,
+			# so the build is shared and each state takes its own copy.
+			graph, tonic, diatonic, function_chords = _build_graph_style(
+				graph_style, include_dominant_7th, minor_turnaround_weight, key_name
+			)
+			self.graph = graph.copy()
+			self._diatonic_chords, self._function_chords = set(diatonic), set(function_chords)
 
 		else:
-			chord_graph = graph_style
-
-		self.graph, tonic = chord_graph.build(key_name)
-		self._diatonic_chords, self._function_chords = chord_graph.gravity_sets(key_name)
+			self.graph, tonic = graph_style.build(key_name)
+			self._diatonic_chords, self._function_chords = graph_style.gravity_sets(key_name)
+		self._gravity_boost_cache: typing.Tuple[typing.Optional[float], typing.Dict[subsequence.chords.Chord, float]] = (None, {})
 
 		self.rng = rng or random.Random()
 		self.current_chord = tonic
@@ -165,62 +285,7 @@ class HarmonicState:
 		if len(self.history) < 2:
 			return 1.0
 
-		prev = self.history[-2]
-
-		# Calculate interval from Prev -> Source (The "Implication" generator)
-		# Using shortest-path distance in Pitch Class space (-6 to +6)
-		prev_diff = (source.root_pc - prev.root_pc) % 12
-		if prev_diff > 6:
-			prev_diff -= 12
-
-		prev_interval = abs(prev_diff)
-		prev_direction = 1 if prev_diff > 0 else -1 if prev_diff < 0 else 0
-
-		# Calculate interval from Source -> Target (The "Realization")
-		target_diff = (target.root_pc - source.root_pc) % 12
-		if target_diff > 6:
-			target_diff -= 12
-
-		target_interval = abs(target_diff)
-		target_direction = 1 if target_diff > 0 else -1 if target_diff < 0 else 0
-
-		score = 1.0
-
-		# --- Rule A: Reversal (Gap Fill) ---
-		# If the previous step was a large leap (> 4 on the 0–6 pitch-class
-		# shortest-path scale, where a tritone is 6), expect a direction change.
-		if prev_interval > 4:
-			# Expect change in direction
-			if target_direction != prev_direction and target_direction != 0:
-				score += 0.5
-
-			# Expect smaller interval (Gap Fill)
-			if target_interval < 4:
-				score += 0.3
-
-		# --- Rule B: Process (Continuation/Inertia) ---
-		# If previous was Small Step (< 3 semitones), expect similarity.
-		elif prev_interval > 0 and prev_interval < 3:
-			# Expect same direction
-			if target_direction == prev_direction:
-				score += 0.4
-
-			# Expect similar size
-			if abs(target_interval - prev_interval) <= 1:
-				score += 0.2
-
-		# --- Rule C: Closure ---
-		# Return to Tonic (Closure) is often implied after tension
-		if target.root_pc == self.key_root_pc:
-			score += 0.2
-
-		# --- Rule D: Proximity ---
-		# General preference for small intervals (≤ 3 semitones).
-		if target_interval > 0 and target_interval <= 3:
-			score += 0.3
-
-		# Scale the boost portion by nir_strength (score starts at 1.0, boost is the excess)
-		return 1.0 + (score - 1.0) * self.nir_strength
+		return _nir_score(self.history[-2].root_pc, source.root_pc, target.root_pc, self.key_root_pc, self.nir_strength)
 
 	def _transition_weight (
 		self,
@@ -249,11 +314,8 @@ class HarmonicState:
 			``(1 + gravity_boost) × nir_score × diversity``
 		"""
 
-		is_function = 1.0 if target in self._function_chords else 0.0
-		is_diatonic = 1.0 if target in self._diatonic_chords else 0.0
-
 		# Decision path: blend controls whether key gravity favors functional or full diatonic chords.
-		boost = (1.0 - self.key_gravity_blend) * is_function + self.key_gravity_blend * is_diatonic
+		boost = self._gravity_boosts().get(target, 0.0)
 
 		# Apply NIR gravity
 		nir_score = self._calculate_nir_score(source, target)
@@ -267,6 +329,27 @@ class HarmonicState:
 
 		return (1.0 + boost) * nir_score * diversity
 
+	def _gravity_boosts (self) -> typing.Dict[subsequence.chords.Chord, float]:
+
+		"""Key-gravity boost per chord in either gravity set, for the current blend.
+
+		Chords outside both sets get no boost.  Rebuilt only when
+		``key_gravity_blend`` changes, so each candidate costs one dict lookup.
+		"""
+
+		blend, boosts = self._gravity_boost_cache
+
+		if blend != self.key_gravity_blend:
+			blend = self.key_gravity_blend
+			boosts = {
+				chord: (1.0 - blend) * (1.0 if chord in self._function_chords else 0.0)
+					+ blend * (1.0 if chord in self._diatonic_chords else 0.0)
+				for chord in self._function_chords | self._diatonic_chords
+			}
+			self._gravity_boost_cache = (blend, boosts)
+
+		return boosts
+
 	def _record_transition_source (self, chord: subsequence.chords.Chord) -> None:
 
 		"""History bookkeeping for one transition: the outgoing chord enters history.
@@ -292,6 +375,39 @@ class HarmonicState:
 
 		return self.current_chord
 
+	def step_n (self, n: int) -> typing.List[subsequence.chords.Chord]:
+
+		"""Advance *n* chords and return them in order.
+
+		Draw-for-draw equivalent to calling :meth:`step` *n* times.  The
+		weighted transition table depends only on the history (whose last
+		entry is the outgoing chord), so each distinct history is weighted
+		once per call and reused whenever the walk revisits it.
+		"""
+
+		tables: typing.Dict[
+			typing.Tuple[subsequence.chords.Chord, ...],
+			typing.Tuple[typing.List[subsequence.chords.Chord], typing.List[float]]
+		] = {}
+		chords: typing.List[subsequence.chords.Chord] = []
+
+		for _ in range(n):
+			self._record_transition_source(self.current_chord)
+
+			# After the bookkeeping, history[-1] is current_chord, so the
+			# history alone identifies the state.
+			state = tuple(self.history)
+			table = tables.get(state)
+
+			if table is None:
+				table = self.graph.cumulative_weights(self.current_chord, self._transition_weight)
+				tables[state] = table
+
+			self.current_chord = self.graph.choose_from_table(self.current_chord, table, self.rng)
+			chords.append(self.current_chord)
+
+		return chords
+
 	def plan_next (self) -> subsequence.chords.Chord:
 
 		"""Choose the next chord without committing it — the horizon's pre-step.
@@ -5,6 +5,7 @@ Standalone convenience functions (``diatonic_chords``, ``diatonic_chord``,
 generative progressions use ``progressions``.
 """
 
+import functools
 import typing
 
 import subsequence.chords
@@ -46,7 +47,7 @@ def diatonic_chords (key: str, mode: str = "ionian") -> typing.List[subsequence.
 		available = ", ".join(sorted(subsequence.intervals.SCALE_MODE_MAP.keys()))
 		raise ValueError(f"Unknown mode: {mode!r}. Available: {available}")
 
-	_, qualities = subsequence.intervals.SCALE_MODE_MAP[mode]
+	scale_key, qualities = subsequence.intervals.SCALE_MODE_MAP[mode]
 
 	if qualities is None:
 		raise ValueError(
@@ -55,12 +56,30 @@ def diatonic_chords (key: str, mode: str = "ionian") -> typing.List[subsequence.
 			"or use p.snap_to_scale() for pitch snapping without harmony."
 		)
 	key_pc = subsequence.chords.key_name_to_pc(key)
-	scale_pcs = subsequence.intervals.scale_pitch_classes(key_pc, mode)
 
-	return [
-		subsequence.chords.Chord(root_pc=root_pc, quality=quality)
-		for root_pc, quality in zip(scale_pcs, qualities)
-	]
+	# Keyed on the mode's definition rather than its name, so re-registering
+	# a custom scale is seen immediately.  A fresh list each call: the Chords
+	# are frozen and safely shared, the list is the caller's.
+	return list(_diatonic_triads(
+		key_pc,
+		tuple(subsequence.intervals.get_intervals(scale_key)),
+		tuple(qualities),
+	))
+
+
+@functools.lru_cache(maxsize=256)
+def _diatonic_triads (
+	key_pc: int,
+	intervals: typing.Tuple[int, ...],
+	qualities: typing.Tuple[str, ...],
+) -> typing.Tuple[subsequence.chords.Chord, ...]:
+
+	"""Build one Chord per scale degree; memoised by :func:`diatonic_chords`."""
+
+	return tuple(
+		subsequence.chords.Chord(root_pc=(key_pc + interval) % 12, quality=quality)
+		for interval, quality in zip(intervals, qualities)
+	)
 
 
 def diatonic_chord (
@@ -105,28 +105,30 @@ class LiveServer:
 
 	async def _read_message (self, reader: asyncio.StreamReader) -> typing.Optional[str]:
 
-		"""Read bytes until the sentinel or EOF, returning the decoded string or None."""
+		"""Read bytes until the sentinel or EOF, returning the decoded string or None.
+
+		Only the bytes up to and including the sentinel are consumed, so a
+		client may pipeline several messages on one connection.
+		"""
 
 		chunks: typing.List[bytes] = []
 
-		while True:
+		try:
 
-			try:
-				chunk = await reader.read(4096)
-			except ConnectionResetError:
-				return None
+			while True:
 
-			if not chunk:
-				return None
+				try:
+					chunks.append(await reader.readuntil(SENTINEL))
+					break
 
-			if SENTINEL in chunk:
-				before, _, _ = chunk.partition(SENTINEL)
-				chunks.append(before)
-				break
+				except asyncio.LimitOverrunError as exc:
+					# Longer than the stream buffer limit - take the sentinel-free prefix and keep reading.
+					chunks.append(await reader.readexactly(exc.consumed))
 
-			chunks.append(chunk)
+		except (asyncio.IncompleteReadError, ConnectionResetError):
+			return None
 
-		data = b"".join(chunks).decode("utf-8").strip()
+		data = b"".join(chunks)[:-len(SENTINEL)].decode("utf-8").strip()
 
 		return data if data else None
 
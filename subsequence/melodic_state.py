@@ -21,7 +21,9 @@ a dial and never a law.  Replace or extend the list to reshape the
 generator's taste.
 """
 
+import bisect
 import dataclasses
+import itertools
 import random
 import typing
 
@@ -297,9 +299,10 @@ class MelodicState:
 
 		self._tonic_pc: int = subsequence.chords.key_name_to_pc(self.key)
 
-		self._pitch_pool: typing.List[int] = subsequence.intervals.scale_notes(
+		# Read-only once built; a tuple so clones and callers can share it safely.
+		self._pitch_pool: typing.Tuple[int, ...] = tuple(subsequence.intervals.scale_notes(
 			self.key, self.mode, low=self.low, high=self.high
-		)
+		))
 
 
 	def configure_defaults (self, key: typing.Optional[str], mode: typing.Optional[str]) -> None:
@@ -348,7 +351,7 @@ class MelodicState:
 		if not pool:
 			raise ValueError("set_pool() needs at least one pitch")
 
-		self._pitch_pool = pool
+		self._pitch_pool = tuple(pool)
 		self._explicit_pool = True
 		self.low = pool[0]
 		self.high = max(pool[-1], pool[0] + 1)
@@ -411,49 +414,67 @@ class MelodicState:
 			return None
 
 		# Resolve chord tones to pitch classes for fast membership testing.
-		chord_tone_pcs = {t % 12 for t in chord_tones} if chord_tones else set()
+		chord_tone_pcs = frozenset(t % 12 for t in chord_tones) if chord_tones else frozenset()
 
-		scores = [
-			self._score_candidate(candidate, chord_tone_pcs, beat=beat, position=position, contour_target=contour_target)
-			for candidate in self._pitch_pool
-		]
+		scores = self._score_pool(chord_tone_pcs, beat=beat, position=position, contour_target=contour_target)
 
-		# Weighted random choice: select using cumulative score as a probability weight.
-		total = sum(scores)
+		# Weighted random choice: bisect the running score totals.
+		cumulative = list(itertools.accumulate(scores))
+		total = cumulative[-1]
 
 		if total <= 0.0:
 			chosen = rng.choice(self._pitch_pool)
 
 		else:
 			r = rng.uniform(0.0, total)
-			cumulative = 0.0
-			chosen = self._pitch_pool[-1]
-
-			for pitch, score in zip(self._pitch_pool, scores):
-				cumulative += score
-				if r <= cumulative:
-					chosen = pitch
-					break
+			chosen = self._pitch_pool[min(bisect.bisect_left(cumulative, r), len(self._pitch_pool) - 1)]
 
 		self.record(chosen)
 
 		return chosen
 
 
+	def _score_pool (
+		self,
+		chord_tone_pcs: typing.FrozenSet[int],
+		beat: typing.Optional[float] = None,
+		position: typing.Optional[float] = None,
+		contour_target: typing.Optional[float] = None,
+	) -> typing.List[float]:
+
+		"""Score every pitch-pool candidate, in pool order.
+
+		The history tuple is shared by the whole pool, so it is resolved once
+		here and handed to :meth:`_score_candidate` for each pitch.
+		"""
+
+		history = tuple(self.history)
+
+		return [
+			self._score_candidate(candidate, chord_tone_pcs, beat=beat, position=position, contour_target=contour_target, history=history)
+			for candidate in self._pitch_pool
+		]
+
+
 	def _score_candidate (
 		self,
 		candidate: int,
-		chord_tone_pcs: typing.Set[int],
+		chord_tone_pcs: typing.AbstractSet[int],
 		beat: typing.Optional[float] = None,
 		position: typing.Optional[float] = None,
 		contour_target: typing.Optional[float] = None,
+		history: typing.Optional[typing.Tuple[int, ...]] = None,
 	) -> float:
 
-		"""Score one candidate: the product of every factor in :attr:`factors`."""
+		"""Score one candidate: the product of every factor in :attr:`factors`.
+
+		*history* lets a caller scoring many candidates pass the history tuple
+		it has already built; it defaults to a snapshot of :attr:`history`.
+		"""
 
 		ctx = ScoringContext(
 			candidate = candidate,
-			history = tuple(self.history),
+			history = tuple(self.history) if history is None else history,
 			chord_tone_pcs = frozenset(chord_tone_pcs),
 			tonic_pc = self._tonic_pc,
 			low = self.low,
@@ -26,7 +26,7 @@ MirrorSpec = typing.Union[
 ]
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Note:
 
 	"""
@@ -86,7 +86,7 @@ class OscEvent:
 	args: typing.Tuple[typing.Any, ...] = ()
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Step:
 
 	"""
@@ -695,9 +695,7 @@ class ChordSpan:
 			dropped = [i - 12 if position in (len(intervals) - 2, len(intervals) - 4) else i for position, i in enumerate(intervals)]
 			intervals = sorted(dropped)
 
-		offset = (self.chord.root_pc - root) % 12
-		if offset > 6:
-			offset -= 12
+		offset = subsequence.chords.SIGNED_PC_STEP[(self.chord.root_pc - root) % 12]
 		effective_root = root + offset
 
 		if count is not None:
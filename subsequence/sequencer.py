@@ -402,7 +402,7 @@ class Sequencer:
 		self._midi_input_queue: typing.Optional[asyncio.Queue] = None
 		self._input_loop: typing.Optional[asyncio.AbstractEventLoop] = None
 		self._event_loop: typing.Optional[asyncio.AbstractEventLoop] = None
-		self._clock_tick_times: typing.List[float] = []
+		self._clock_tick_times: typing.Deque[float] = collections.deque(maxlen=24)
 		self._waiting_for_start: bool = False
 
 		self.event_queue: typing.List[MidiEvent] = []
@@ -859,16 +859,12 @@ class Sequencer:
 
 		"""Estimate BPM from recent MIDI clock tick timestamps for display and recording."""
 
-		self._clock_tick_times.append(tick_time)
+		ticks = self._clock_tick_times
+		ticks.append(tick_time)
 
-		# Keep last 48 ticks (2 beats) for averaging.
-		if len(self._clock_tick_times) > 48:
-			self._clock_tick_times = self._clock_tick_times[-48:]
-
-		if len(self._clock_tick_times) >= 24:
-			# Average interval over last 24 ticks (1 beat).
-			recent = self._clock_tick_times[-24:]
-			interval = (recent[-1] - recent[0]) / (len(recent) - 1)
+		# The deque holds the last 24 ticks (1 beat); average once it is full.
+		if len(ticks) == ticks.maxlen:
+			interval = (ticks[-1] - ticks[0]) / (len(ticks) - 1)
 
 			if interval > 0:
 				new_bpm = int(round(60.0 / (interval * self.pulses_per_beat)))
@@ -1585,12 +1581,22 @@ class Sequencer:
 
 		while self.running:
 
+			# Drain any backlog without the timeout machinery: wait_for wraps
+			# each get() in a task and a timer (~25 µs), which adds up when
+			# ticks queue behind a slow pulse.  Only an empty queue waits.
 			try:
-				device_idx, message = await asyncio.wait_for(
-					self._midi_input_queue.get(), timeout=2.0
-				)
-			except asyncio.TimeoutError:
-				continue
+				device_idx, message = self._midi_input_queue.get_nowait()
+			except asyncio.QueueEmpty:
+				try:
+					device_idx, message = await asyncio.wait_for(
+						self._midi_input_queue.get(), timeout=2.0
+					)
+				except asyncio.TimeoutError:
+					continue
+			else:
+				# A bare yield (~4 µs) keeps other tasks interleaving with a
+				# burst, as they did when every message was awaited.
+				await asyncio.sleep(0)
 
 			if device_idx != self.clock_device_idx:
 				continue
@@ -1,3 +1,5 @@
+import bisect
+import itertools
 import random
 import typing
 
@@ -21,6 +23,11 @@ class WeightedGraph (typing.Generic[NodeType]):
 		self._edges: typing.Dict[NodeType, typing.Dict[NodeType, int]] = {}
 		self._labels: typing.Dict[typing.Tuple[NodeType, NodeType], str] = {}
 
+		# Unmodified picks (form graphs, most chord walks) reuse a per-source
+		# (targets, cumulative weights) table instead of re-accumulating the
+		# edge list on every call.  Dropped per source by add_transition().
+		self._cumulative: typing.Dict[NodeType, typing.Tuple[typing.List[NodeType], typing.List[float]]] = {}
+
 
 	def add_transition (self, source: NodeType, target: NodeType, weight: int, label: typing.Optional[str] = None) -> None:
 
@@ -54,6 +61,25 @@ class WeightedGraph (typing.Generic[NodeType]):
 		if label is not None:
 			self._labels[(source, target)] = label
 
+		self._cumulative.pop(source, None)
+
+
+	def copy (self) -> "WeightedGraph[NodeType]":
+
+		"""
+		Return an independent copy: adding transitions to either graph
+		leaves the other untouched.  Nodes themselves are shared.
+		"""
+
+		duplicate: WeightedGraph[NodeType] = WeightedGraph()
+		duplicate._edges = {source: dict(targets) for source, targets in self._edges.items()}
+		duplicate._labels = dict(self._labels)
+
+		# The cumulative tables are never mutated in place, only dropped.
+		duplicate._cumulative = dict(self._cumulative)
+
+		return duplicate
+
 
 	def get_label (self, source: NodeType, target: NodeType) -> typing.Optional[str]:
 
@@ -106,6 +132,16 @@ class WeightedGraph (typing.Generic[NodeType]):
 		return list(self._edges[source].items())
 
 
+	def get_weight (self, source: NodeType, target: NodeType) -> int:
+
+		"""
+		Return the weight of the transition from *source* to *target*, or 0
+		if there is no such transition.
+		"""
+
+		return self._edges.get(source, {}).get(target, 0)
+
+
 	def choose_next (self, source: NodeType, rng: random.Random, weight_modifier: WeightModifierType = None) -> NodeType:
 
 		"""
@@ -116,16 +152,29 @@ class WeightedGraph (typing.Generic[NodeType]):
 		modifier that returned zero or a negative value.
 		"""
 
-		options = self.get_transitions(source)
+		if weight_modifier is None:
+			return self._choose_unmodified(source, rng)
 
-		if not options:
-			# Decision path: with no outgoing edges we remain on the current node.
-			return source
+		return self.choose_from_table(source, self.cumulative_weights(source, weight_modifier), rng)
+
+
+	def cumulative_weights (self, source: NodeType, weight_modifier: WeightModifierType = None) -> typing.Tuple[typing.List[NodeType], typing.List[float]]:
+
+		"""
+		Return ``(targets, running weight totals)`` for *source* after applying
+		*weight_modifier*.
 
-		adjusted: typing.List[typing.Tuple[NodeType, float]] = []
+		Transitions the modifier suppresses (zero or negative) are omitted;
+		both lists are empty when nothing survives.  Pass the result to
+		:meth:`choose_from_table` to draw from it, as often as the modifier's
+		inputs stay the same.
+		"""
+
+		targets: typing.List[NodeType] = []
+		cumulative: typing.List[float] = []
 		total_weight = 0.0
 
-		for target, weight in options:
+		for target, weight in self._edges.get(source, {}).items():
 
 			if weight_modifier is None:
 				modifier = 1.0
@@ -137,20 +186,54 @@ class WeightedGraph (typing.Generic[NodeType]):
 				# Decision path: non-positive modifiers suppress this transition entirely.
 				continue
 
-			adjusted_weight = float(weight) * modifier
-			adjusted.append((target, adjusted_weight))
-			total_weight += adjusted_weight
+			total_weight += float(weight) * modifier
+			targets.append(target)
+			cumulative.append(total_weight)
+
+		return targets, cumulative
+
+
+	def choose_from_table (self, source: NodeType, table: typing.Tuple[typing.List[NodeType], typing.List[float]], rng: random.Random) -> NodeType:
+
+		"""
+		Weighted pick from a :meth:`cumulative_weights` table.
+
+		Returns *source* when the table is empty (no transitions, or all
+		suppressed).  One ``rng.uniform`` over the total; the first target
+		whose running sum reaches the roll wins.
+		"""
+
+		nodes, cumulative = table
 
-		if total_weight <= 0:
+		if not nodes or cumulative[-1] <= 0:
 			# Decision path: if every transition is suppressed, stay on the current node.
 			return source
 
-		roll = rng.uniform(0, total_weight)
-		accum = 0.0
+		roll = rng.uniform(0, cumulative[-1])
+
+		return nodes[min(bisect.bisect_left(cumulative, roll), len(nodes) - 1)]
+
+
+	def _choose_unmodified (self, source: NodeType, rng: random.Random) -> NodeType:
+
+		"""
+		Weighted pick with no modifier, by bisecting a cached cumulative table.
+
+		Draws exactly as the general path does (one ``rng.uniform`` over the
+		total, first target whose running sum reaches the roll), so seeded
+		walks are unchanged.
+		"""
+
+		table = self._cumulative.get(source)
+
+		if table is None:
+			targets = self._edges.get(source)
+
+			if not targets:
+				# Decision path: with no outgoing edges we remain on the current node.
+				return source
 
-		for target, adj_weight in adjusted:
-			accum += adj_weight
-			if roll <= accum:
-				return target
+			table = (list(targets), list(itertools.accumulate(float(weight) for weight in targets.values())))
+			self._cumulative[source] = table
 
-		return adjusted[-1][0]
+		return self.choose_from_table(source, table, rng)
@@ -1,5 +1,8 @@
 """Tests for register_chord_quality(), the diminished_7th builtin, and Chord.name() fallback."""
 
+import copy
+import pickle
+
 import pytest
 
 import subsequence.chords
@@ -141,3 +144,41 @@ def test_register_quality_rejects_ambiguous_suffix () -> None:
 		subsequence.chords.register_chord_quality("weird", [0, 1, 2], suffix="A1")
 	with pytest.raises(ValueError, match="ambiguous"):
 		subsequence.chords.register_chord_quality("weird", [0, 1, 2], suffix="9th")
+
+
+def test_chord_hash_survives_copy_and_pickle () -> None:
+
+	"""The cached hash is rebuilt on copy/unpickle, so copies still key the same dict slot."""
+
+	chord = subsequence.chords.Chord(root_pc=7, quality="dominant_7th")
+	lookup = {chord: "V7"}
+
+	for clone in (copy.copy(chord), copy.deepcopy(chord), pickle.loads(pickle.dumps(chord))):
+		assert clone == chord
+		assert hash(clone) == hash(chord)
+		assert lookup[clone] == "V7"
+
+	assert repr(chord) == "Chord(root_pc=7, quality='dominant_7th')"
+
+
+def test_equal_chords_are_interned () -> None:
+
+	"""Constructing an equal chord returns the same instance, positional or keyword."""
+
+	assert subsequence.chords.Chord(2, "minor") is subsequence.chords.Chord(root_pc=2, quality="minor")
+	assert subsequence.chords.Chord(2, "minor") is not subsequence.chords.Chord(2, "major")
+
+
+def test_interned_chord_rejects_non_integer_roots () -> None:
+
+	"""Roots are validated and folded to a pitch class before the pool lookup."""
+
+	chord = subsequence.chords.Chord(1, "major")
+
+	assert subsequence.chords.Chord(13, "major") is chord
+
+	for bad_root in (True, 1.0, "1"):
+		with pytest.raises(ValueError, match="root_pc"):
+			subsequence.chords.Chord(bad_root, "major")
+
+	assert chord.root_pc == 1 and type(chord.root_pc) is int
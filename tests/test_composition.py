@@ -695,6 +695,41 @@ def test_layer_with_chord_injection (patch_midi: None) -> None:
 	assert total_notes == 2
 
 
+def test_layer_inspects_signatures_once (patch_midi: None, monkeypatch: pytest.MonkeyPatch) -> None:
+
+	"""layer() reads each builder's signature at registration, not on every rebuild."""
+
+	composition = subsequence.Composition(output_device="Dummy MIDI", bpm=125, key="C")
+	composition.harmony(style="diatonic_major", cycle_beats=4)
+
+	def bass (p: "subsequence.pattern_builder.PatternBuilder", chord: "subsequence.chords.Chord") -> None:
+		p.note(chord.root_note(36), beat=0, velocity=100)
+
+	def rhythm (p: "subsequence.pattern_builder.PatternBuilder") -> None:
+		p.note(60, beat=1, velocity=80)
+
+	inspected: typing.List[str] = []
+	original = subsequence.composition._fn_has_parameter
+
+	def counting (fn: typing.Callable, name: str) -> bool:
+		if fn in (bass, rhythm):
+			inspected.append(fn.__name__)
+		return original(fn, name)
+
+	monkeypatch.setattr(subsequence.composition, "_fn_has_parameter", counting)
+
+	composition.layer(bass, rhythm, channel=1, beats=4)
+	registered = len(inspected)
+
+	pattern = composition._build_pattern_from_pending(composition._pending_patterns[0])
+	pattern.on_reschedule()
+	pattern.on_reschedule()
+
+	assert registered == 2
+	assert len(inspected) == registered
+	assert sum(len(step.notes) for step in pattern.steps.values()) == 2
+
+
 # --- Tweak ---
 
 
@@ -147,6 +147,21 @@ def test_register_scale_with_qualities () -> None:
 		assert len(chords) == 5
 
 
+def test_diatonic_chords_follow_scale_re_registration () -> None:
+
+	"""Re-registering a custom scale (as live reload does) changes its diatonic chords."""
+
+	with _scratch_scale("test_rereg"):
+		subsequence.intervals.register_scale("test_rereg", [0, 4, 7], qualities=["major", "major", "major"])
+		first = subsequence.harmony.diatonic_chords("C", mode="test_rereg")
+
+		subsequence.intervals.register_scale("test_rereg", [0, 3, 7], qualities=["minor", "major", "major"])
+		second = subsequence.harmony.diatonic_chords("C", mode="test_rereg")
+
+		assert [c.root_pc for c in first] == [0, 4, 7]
+		assert [(c.root_pc, c.quality) for c in second] == [(0, "minor"), (3, "major"), (7, "major")]
+
+
 def test_register_scale_quantize () -> None:
 
 	"""A registered custom scale works with quantize_pitch."""
@@ -1,3 +1,4 @@
+import dataclasses
 import random
 import typing
 
@@ -139,6 +140,36 @@ def test_form_state_generator () -> None:
 	assert form.get_section_info() is None
 
 
+def test_form_state_generator_is_consumed_lazily () -> None:
+
+	"""A generator form is read one section ahead, never per bar — infinite forms work."""
+
+	pulled: typing.List[int] = []
+
+	def endless () -> typing.Iterator[typing.Tuple[str, int]]:
+		index = 0
+		while True:
+			pulled.append(index)
+			yield (f"part{index}", 4)
+			index += 1
+
+	form = subsequence.form_state.FormState(endless())
+
+	# The current section plus the next-section lookahead.
+	assert len(pulled) == 2
+
+	for _ in range(3):
+		form.advance()
+
+	assert len(pulled) == 2
+
+	form.advance()
+
+	assert form.get_section_info().name == "part1"
+	assert form.get_section_info().next_section == "part2"
+	assert len(pulled) == 3
+
+
 def test_form_state_total_bars () -> None:
 
 	"""The total_bars counter should track the global bar count across sections."""
@@ -191,6 +222,61 @@ def test_section_info_first_last_bar () -> None:
 	assert mid.last_bar is False
 
 
+def test_section_info_is_immutable () -> None:
+
+	"""SectionInfo is a snapshot — writing to it should raise."""
+
+	info = subsequence.form_state.SectionInfo(name="A", bar=0, bars=4, index=0)
+
+	with pytest.raises(dataclasses.FrozenInstanceError):
+		info.bar = 1  # type: ignore[misc]
+
+
+def test_section_info_derived_fields_follow_replace () -> None:
+
+	"""progress/first_bar/last_bar are derived at construction, so replace() recomputes them."""
+
+	info = subsequence.form_state.SectionInfo(name="A", bar=0, bars=4, index=0)
+	last = dataclasses.replace(info, bar=3)
+
+	assert last.progress == 0.75
+	assert last.first_bar is False
+	assert last.last_bar is True
+	assert not hasattr(last, "__dict__")
+
+	empty = subsequence.form_state.SectionInfo(name="A", bar=0, bars=0, index=0)
+	assert empty.progress == 0.0
+
+
+def test_get_section_info_cached_until_form_moves () -> None:
+
+	"""Repeated reads within a bar share one snapshot; moving the form refreshes it."""
+
+	form = subsequence.form_state.FormState({
+		"a": (2, [("b", 1)]),
+		"b": (2, [("a", 1)]),
+		"c": (2, [("a", 1)]),
+	}, start="a")
+
+	first = form.get_section_info()
+	assert form.get_section_info() is first
+
+	form.queue_next("c")
+	queued = form.get_section_info()
+	assert queued is not first
+	assert queued.next_section == "c"
+
+	form.advance()
+	advanced = form.get_section_info()
+	assert advanced is not queued
+	assert advanced.bar == 1
+
+	form.jump_to("b")
+	jumped = form.get_section_info()
+	assert jumped.name == "b"
+	assert jumped.bar == 0
+
+
 # --- Composition integration ---
 
 
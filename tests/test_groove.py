@@ -1,3 +1,5 @@
+import functools
+import io
 import os
 
 import pytest
@@ -6,18 +8,19 @@ import subsequence.groove
 import subsequence.pattern
 
 
+_AGR_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "examples", "assets", "Swing 16ths 57.agr")
+
+
 def _make_steps (*pulses: int, velocity: int = 100) -> dict:
 
 	"""
 	Build a steps dict with one note per pulse position.
 	"""
 
-	steps = {}
-	for p in pulses:
-		steps[p] = subsequence.pattern.Step(notes=[
-			subsequence.pattern.Note(pitch=60, velocity=velocity, duration=6, channel=0)
-		])
-	return steps
+	return {
+		p: subsequence.pattern.Step(notes=[subsequence.pattern.Note(pitch=60, velocity=velocity, duration=6, channel=0)])
+		for p in pulses
+	}
 
 
 # ── Groove.swing() factory ───────────────────────────────────────────
@@ -102,7 +105,32 @@ def test_apply_groove_straight_no_change () -> None:
 
 	result = subsequence.groove.apply_groove(steps, g, pulses_per_quarter=24)
 
-	assert set(result.keys()) == {0, 6, 12, 18}
+	assert result.keys() == {0, 6, 12, 18}
+
+
+def test_apply_groove_straight_skips_rebuild () -> None:
+
+	"""A straight groove over quantised notes hands back the original Steps."""
+
+	steps = _make_steps(0, 6, 12, 18)
+	g = subsequence.groove.Groove.swing(percent=50.0)
+
+	result = subsequence.groove.apply_groove(steps, g, pulses_per_quarter=24)
+
+	assert result is not steps
+	assert all(result[pulse] is steps[pulse] for pulse in steps)
+
+
+def test_apply_groove_straight_still_snaps_in_window_jitter () -> None:
+
+	"""Straight is not a no-op for micro-timed notes: in-window jitter lands on the grid."""
+
+	steps = _make_steps(0, 7)
+	g = subsequence.groove.Groove.swing(percent=50.0)
+
+	result = subsequence.groove.apply_groove(steps, g, pulses_per_quarter=24)
+
+	assert result.keys() == {0, 6}
 
 
 def test_apply_groove_empty_pattern () -> None:
@@ -128,6 +156,20 @@ def test_apply_groove_notes_between_grid_untouched () -> None:
 	assert 3 in result
 
 
+def test_apply_groove_capture_window_edge () -> None:
+
+	"""A note exactly a quarter-cell off the grid is grooved; one pulse further is not."""
+
+	# 96 PPQN, 16th grid → 24-pulse cells, capture window ±6 pulses.
+	steps = _make_steps(30, 55, velocity=100)
+	g = subsequence.groove.Groove(offsets=[0.0, 0.0, 0.0], grid=0.25, velocities=[1.0, 0.5, 1.0])
+
+	result = subsequence.groove.apply_groove(steps, g, pulses_per_quarter=96)
+
+	assert result[24].notes[0].velocity == 50
+	assert result[55].notes[0].velocity == 100
+
+
 def test_apply_groove_velocity_scaling () -> None:
 
 	"""Velocity scaling adjusts note velocities per grid slot."""
@@ -162,6 +204,30 @@ def test_apply_groove_velocity_clamp () -> None:
 	assert result[0].notes[0].velocity == 127
 
 
+def test_apply_groove_velocity_clamp_floor () -> None:
+
+	"""A scale that would reach zero clamps to velocity 1, never silence."""
+
+	steps = _make_steps(0, velocity=100)
+	g = subsequence.groove.Groove(offsets=[0.0], grid=0.25, velocities=[0.0])
+
+	result = subsequence.groove.apply_groove(steps, g, pulses_per_quarter=24)
+	assert result[0].notes[0].velocity == 1
+
+
+def test_apply_groove_unit_velocity_slot_keeps_notes () -> None:
+
+	"""A 1.0 velocity slot leaves the note untouched rather than copying it."""
+
+	steps = _make_steps(0, 6, velocity=90)
+	g = subsequence.groove.Groove(offsets=[0.0, 0.0], grid=0.25, velocities=[1.0, 0.5])
+
+	result = subsequence.groove.apply_groove(steps, g, pulses_per_quarter=24)
+
+	assert result[0].notes[0] is steps[0].notes[0]
+	assert result[6].notes[0].velocity == 45
+
+
 def test_apply_groove_cyclic_repetition () -> None:
 
 	"""Short offset list repeats cyclically across more grid positions."""
@@ -208,6 +274,22 @@ def test_apply_groove_preserves_note_data () -> None:
 	assert note.channel == 5
 
 
+def test_apply_groove_merges_collisions_without_touching_input () -> None:
+
+	"""Two notes grooved onto one pulse share a Step; the input Steps are not modified."""
+
+	steps = _make_steps(6, 7)
+	g = subsequence.groove.Groove(offsets=[0.0, 0.035], grid=0.25)
+
+	result = subsequence.groove.apply_groove(steps, g, pulses_per_quarter=24)
+
+	assert result.keys() == {7}
+	assert len(result[7].notes) == 2
+	assert len(steps[6].notes) == 1
+	assert len(steps[7].notes) == 1
+	assert result[7] is not steps[7]
+
+
 # ── Groove.from_agr() ───────────────────────────────────────────────
 
 def test_from_agr_parses_swing_16ths_57 () -> None:
@@ -218,9 +300,7 @@ def test_from_agr_parses_swing_16ths_57 () -> None:
 	failure, so there is deliberately no existence guard here.
 	"""
 
-	agr_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "examples", "assets", "Swing 16ths 57.agr")
-
-	g = subsequence.groove.Groove.from_agr(agr_path)
+	g = subsequence.groove.Groove.from_agr(_AGR_PATH)
 
 	# 16 notes in 4 beats → 16th note grid
 	assert abs(g.grid - 0.25) < 1e-9
@@ -242,9 +322,7 @@ def test_from_agr_matches_swing_factory () -> None:
 
 	"""The .agr import and Groove.swing(57) produce equivalent offsets."""
 
-	agr_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "examples", "assets", "Swing 16ths 57.agr")
-
-	agr_groove = subsequence.groove.Groove.from_agr(agr_path)
+	agr_groove = subsequence.groove.Groove.from_agr(_AGR_PATH)
 	factory_groove = subsequence.groove.Groove.swing(percent=57.0)
 
 	# The factory produces a 2-slot repeating pattern
@@ -254,14 +332,13 @@ def test_from_agr_matches_swing_factory () -> None:
 		assert abs(agr_groove.offsets[i] - factory_groove.offsets[slot]) < 0.001
 
 
-def _write_agr (path: str, timing_amount: float = 100.0, velocity_amount: float = 100.0, note_times_and_velocities = None) -> None:
+_DEFAULT_AGR_NOTES = ((0.0, 127), (0.285, 127), (0.5, 127), (0.785, 127))
+
 
-	"""Write a minimal synthetic .agr file for testing."""
+@functools.lru_cache(maxsize=None)
+def _agr_xml (timing_amount: float, velocity_amount: float, note_times_and_velocities: tuple) -> str:
 
-	if note_times_and_velocities is None:
-		note_times_and_velocities = [
-			(0.0, 127), (0.285, 127), (0.5, 127), (0.785, 127),
-		]
+	"""Build (once per distinct input) the XML of a minimal synthetic .agr file."""
 
 	notes_xml = "\n\t\t\t\t\t\t\t\t\t".join(
 		f'<MidiNoteEvent Time="{t}" Duration="0.0625" Velocity="{v}" '
@@ -270,7 +347,7 @@ def _write_agr (path: str, timing_amount: float = 100.0, velocity_amount: float
 		for i, (t, v) in enumerate(note_times_and_velocities)
 	)
 
-	content = (
+	return (
 		"<?xml version='1.0' encoding='UTF-8'?>\n"
 		"<Ableton MajorVersion=\"5\">\n"
 		"\t<Groove>\n"
@@ -286,114 +363,101 @@ def _write_agr (path: str, timing_amount: float = 100.0, velocity_amount: float
 		"\t</Groove>\n"
 		"</Ableton>\n"
 	)
-	with open(path, "w") as f:
-		f.write(content)
 
 
-def test_from_agr_timing_amount_scales_offsets () -> None:
+def _agr_stream (timing_amount: float = 100.0, velocity_amount: float = 100.0, note_times_and_velocities = None) -> io.StringIO:
 
-	"""TimingAmount=50 halves all timing offsets relative to TimingAmount=100."""
+	"""Return a minimal synthetic .agr document as an in-memory stream."""
+
+	notes = _DEFAULT_AGR_NOTES if note_times_and_velocities is None else tuple(note_times_and_velocities)
+
+	return io.StringIO(_agr_xml(timing_amount, velocity_amount, notes))
+
+
+def test_from_agr_stream_matches_file () -> None:
 
-	import tempfile
+	"""Reading the sample groove from an open binary stream matches reading it by path."""
 
-	with tempfile.NamedTemporaryFile(suffix=".agr", delete=False, mode="w") as f:
-		tmp_path = f.name
+	with open(_AGR_PATH, "rb") as stream:
+		from_stream = subsequence.groove.Groove.from_agr_stream(stream)
 
-	try:
-		_write_agr(tmp_path, timing_amount=100.0)
-		g_full = subsequence.groove.Groove.from_agr(tmp_path)
+	assert from_stream == subsequence.groove.Groove.from_agr(_AGR_PATH)
 
-		_write_agr(tmp_path, timing_amount=50.0)
-		g_half = subsequence.groove.Groove.from_agr(tmp_path)
 
-		for i in range(len(g_full.offsets)):
-			assert abs(g_half.offsets[i] - g_full.offsets[i] * 0.5) < 1e-9, \
-				f"Slot {i}: expected half offset, got {g_half.offsets[i]} vs full {g_full.offsets[i]}"
-	finally:
-		os.unlink(tmp_path)
+def test_from_agr_stream_names_source_in_errors () -> None:
+
+	"""A stream without a name is reported as <stream> in parse errors."""
+
+	notes = [(0.0, 127), (0.05, 127)]
+
+	with pytest.raises(ValueError, match="<stream>: two notes share grid cell"):
+		subsequence.groove.Groove.from_agr_stream(_agr_stream(note_times_and_velocities=notes), grid=0.25)
+
+
+def test_from_agr_timing_amount_scales_offsets () -> None:
+
+	"""TimingAmount=50 halves all timing offsets relative to TimingAmount=100."""
+
+	g_full = subsequence.groove.Groove.from_agr_stream(_agr_stream(timing_amount=100.0))
+	g_half = subsequence.groove.Groove.from_agr_stream(_agr_stream(timing_amount=50.0))
+
+	for i in range(len(g_full.offsets)):
+		assert abs(g_half.offsets[i] - g_full.offsets[i] * 0.5) < 1e-9, \
+			f"Slot {i}: expected half offset, got {g_half.offsets[i]} vs full {g_full.offsets[i]}"
 
 
 def test_from_agr_velocity_amount_zero_gives_no_velocity () -> None:
 
 	"""VelocityAmount=0 collapses all velocity deviation to None (no variation)."""
 
-	import tempfile
-
 	notes = [(0.0, 127), (0.25, 80), (0.5, 127), (0.75, 80)]
 
-	with tempfile.NamedTemporaryFile(suffix=".agr", delete=False, mode="w") as f:
-		tmp_path = f.name
+	g = subsequence.groove.Groove.from_agr_stream(_agr_stream(velocity_amount=0.0, note_times_and_velocities=notes))
 
-	try:
-		_write_agr(tmp_path, velocity_amount=0.0, note_times_and_velocities=notes)
-		g = subsequence.groove.Groove.from_agr(tmp_path)
-
-		# velocity_amount=0 → all scales collapse to 1.0 → stored as None
-		assert g.velocities is None
-	finally:
-		os.unlink(tmp_path)
+	# velocity_amount=0 → all scales collapse to 1.0 → stored as None
+	assert g.velocities is None
 
 
 def test_from_agr_velocity_amount_50_blends () -> None:
 
 	"""VelocityAmount=50 produces velocity scales halfway between 1.0 and the raw scale."""
 
-	import tempfile
-
 	# max=127, other=63 → raw_scale ≈ 0.496
 	notes = [(0.0, 127), (0.25, 63)]
 
-	with tempfile.NamedTemporaryFile(suffix=".agr", delete=False, mode="w") as f:
-		tmp_path = f.name
+	g_full = subsequence.groove.Groove.from_agr_stream(_agr_stream(velocity_amount=100.0, note_times_and_velocities=notes))
+	g_half = subsequence.groove.Groove.from_agr_stream(_agr_stream(velocity_amount=50.0, note_times_and_velocities=notes))
 
-	try:
-		_write_agr(tmp_path, velocity_amount=100.0, note_times_and_velocities=notes)
-		g_full = subsequence.groove.Groove.from_agr(tmp_path)
+	assert g_full.velocities is not None
+	assert g_half.velocities is not None
 
-		_write_agr(tmp_path, velocity_amount=50.0, note_times_and_velocities=notes)
-		g_half = subsequence.groove.Groove.from_agr(tmp_path)
-
-		assert g_full.velocities is not None
-		assert g_half.velocities is not None
-
-		for i in range(len(g_full.velocities)):
-			expected = 1.0 + (g_full.velocities[i] - 1.0) * 0.5
-			assert abs(g_half.velocities[i] - expected) < 1e-9, \
-				f"Slot {i}: expected {expected}, got {g_half.velocities[i]}"
-	finally:
-		os.unlink(tmp_path)
+	for i in range(len(g_full.velocities)):
+		expected = 1.0 + (g_full.velocities[i] - 1.0) * 0.5
+		assert abs(g_half.velocities[i] - expected) < 1e-9, \
+			f"Slot {i}: expected {expected}, got {g_half.velocities[i]}"
 
 
 def test_from_agr_out_of_order_events_keep_velocity_pairing () -> None:
 
 	"""MidiNoteEvent elements listed out of time order still pair each note time with ITS OWN velocity."""
 
-	import tempfile
-
 	# Deliberately out of time order, each time with a distinct velocity.
 	notes = [(0.5, 80), (0.0, 127), (0.785, 90), (0.285, 110)]
 
-	with tempfile.NamedTemporaryFile(suffix=".agr", delete=False, mode="w") as f:
-		tmp_path = f.name
+	g = subsequence.groove.Groove.from_agr_stream(_agr_stream(note_times_and_velocities=notes))
 
-	try:
-		_write_agr(tmp_path, note_times_and_velocities=notes)
-		g = subsequence.groove.Groove.from_agr(tmp_path)
+	# Offsets follow time-sorted order: 0.0, 0.285, 0.5, 0.785 on a 0.25 grid.
+	expected_offsets = [0.0, 0.035, 0.0, 0.035]
+	for i in range(4):
+		assert abs(g.offsets[i] - expected_offsets[i]) < 1e-9, \
+			f"Slot {i}: expected offset {expected_offsets[i]}, got {g.offsets[i]}"
 
-		# Offsets follow time-sorted order: 0.0, 0.285, 0.5, 0.785 on a 0.25 grid.
-		expected_offsets = [0.0, 0.035, 0.0, 0.035]
-		for i in range(4):
-			assert abs(g.offsets[i] - expected_offsets[i]) < 1e-9, \
-				f"Slot {i}: expected offset {expected_offsets[i]}, got {g.offsets[i]}"
-
-		# Velocities must travel with their times: 127, 110, 80, 90 (each / max 127).
-		assert g.velocities is not None
-		expected_velocities = [127 / 127, 110 / 127, 80 / 127, 90 / 127]
-		for i in range(4):
-			assert abs(g.velocities[i] - expected_velocities[i]) < 1e-9, \
-				f"Slot {i}: expected velocity scale {expected_velocities[i]}, got {g.velocities[i]}"
-	finally:
-		os.unlink(tmp_path)
+	# Velocities must travel with their times: 127, 110, 80, 90 (each / max 127).
+	assert g.velocities is not None
+	expected_velocities = [127 / 127, 110 / 127, 80 / 127, 90 / 127]
+	for i in range(4):
+		assert abs(g.velocities[i] - expected_velocities[i]) < 1e-9, \
+			f"Slot {i}: expected velocity scale {expected_velocities[i]}, got {g.velocities[i]}"
 
 
 # ── Validation ───────────────────────────────────────────────────────
@@ -435,7 +499,8 @@ def test_apply_groove_strength_zero_no_change () -> None:
 	result = subsequence.groove.apply_groove(steps, g, pulses_per_quarter=24, strength=0.0)
 
 	# All original positions preserved
-	assert set(result.keys()) == {0, 6, 12, 18}
+	assert result.keys() == {0, 6, 12, 18}
+	assert all(result[pulse] is steps[pulse] for pulse in steps)
 
 
 def test_apply_groove_strength_zero_leaves_off_grid_note_untouched () -> None:
@@ -447,7 +512,7 @@ def test_apply_groove_strength_zero_leaves_off_grid_note_untouched () -> None:
 
 	result = subsequence.groove.apply_groove(steps, g, pulses_per_quarter=24, strength=0.0)
 
-	assert set(result.keys()) == {1}
+	assert result.keys() == {1}
 	assert result[1].notes[0].velocity == 100
 
 
@@ -464,14 +529,19 @@ def test_apply_groove_strength_half_timing () -> None:
 	# Full: pulse 6 moves to 7 (offset ≈ +0.84 pulses → rounds to 1)
 	# Half: pulse 6 moves by half that offset → offset ≈ +0.42 → rounds to 0 → stays at 6
 	# The key thing is that half is closer to 6 than full
-	full_pulse = list(result_full.keys())[0]
-	half_pulse = list(result_half.keys())[0]
+	full_pulse = next(iter(result_full))
+	half_pulse = next(iter(result_half))
 
 	# Half-strength offset is less than or equal to full-strength offset
 	assert abs(half_pulse - 6) <= abs(full_pulse - 6)
 
 
-def test_apply_groove_strength_velocity_blend () -> None:
+@pytest.mark.parametrize("strength, expected_velocity", [
+	(1.0, 50),   # 100 * 0.5
+	(0.5, 75),   # 100 * 0.75 (blended halfway)
+	(0.0, 100),  # unchanged
+])
+def test_apply_groove_strength_velocity_blend (strength: float, expected_velocity: int) -> None:
 
 	"""strength blends velocity deviation: 0.0 = no change, 1.0 = full scale."""
 
@@ -482,17 +552,9 @@ def test_apply_groove_strength_velocity_blend () -> None:
 		velocities=[0.5],  # full strength would halve velocity to 50
 	)
 
-	result_full = subsequence.groove.apply_groove(steps, g, pulses_per_quarter=24, strength=1.0)
-	result_half = subsequence.groove.apply_groove(steps, g, pulses_per_quarter=24, strength=0.5)
-	result_zero = subsequence.groove.apply_groove(steps, g, pulses_per_quarter=24, strength=0.0)
+	result = subsequence.groove.apply_groove(steps, g, pulses_per_quarter=24, strength=strength)
 
-	vel_full = result_full[0].notes[0].velocity  # 100 * 0.5 = 50
-	vel_half = result_half[0].notes[0].velocity  # 100 * 0.75 = 75  (blended halfway)
-	vel_zero = result_zero[0].notes[0].velocity  # 100 (unchanged)
-
-	assert vel_full == 50
-	assert vel_half == 75
-	assert vel_zero == 100
+	assert result[0].notes[0].velocity == expected_velocity
 
 
 def test_apply_groove_strength_out_of_range_raises () -> None:
@@ -506,3 +568,31 @@ def test_apply_groove_strength_out_of_range_raises () -> None:
 
 	with pytest.raises(ValueError):
 		subsequence.groove.apply_groove({}, g, strength=1.1)
+
+
+# ── remap cache ──────────────────────────────────────────────────────
+
+def test_apply_groove_reuses_remap_for_repeated_layout () -> None:
+
+	"""Re-grooving the same pulse layout hits the remap cache."""
+
+	g = subsequence.groove.Groove(offsets=[0.0, 0.035], grid=0.25, velocities=[1.0, 0.8])
+
+	first = subsequence.groove.apply_groove(_make_steps(0, 6, 12, 18), g, pulses_per_quarter=24)
+	hits = subsequence.groove._groove_remap.cache_info().hits
+	second = subsequence.groove.apply_groove(_make_steps(0, 6, 12, 18), g, pulses_per_quarter=24)
+
+	assert subsequence.groove._groove_remap.cache_info().hits == hits + 1
+	assert list(second) == list(first)
+	assert [s.notes[0].velocity for s in second.values()] == [s.notes[0].velocity for s in first.values()]
+
+
+def test_apply_groove_sees_in_place_groove_edits () -> None:
+
+	"""Editing a Groove's offsets after use is not masked by the cache."""
+
+	g = subsequence.groove.Groove(offsets=[0.0, 0.0], grid=0.25)
+	assert set(subsequence.groove.apply_groove(_make_steps(6), g, pulses_per_quarter=24)) == {6}
+
+	g.offsets[1] = 0.085
+	assert set(subsequence.groove.apply_groove(_make_steps(6), g, pulses_per_quarter=24)) == {8}
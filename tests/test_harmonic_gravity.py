@@ -1,9 +1,10 @@
 
-import collections
 import random
 
 import typing
 
+import pytest
+
 import subsequence.chords
 import subsequence.harmonic_state
 
@@ -206,31 +207,65 @@ def test_nir_strength_scales_boost () -> None:
 	assert abs(boost_half - boost_full * 0.5) < 0.001
 
 
+
+def test_nir_score_transposition_invariant () -> None:
+
+	"""Transposing every root and the tonic together leaves the NIR score unchanged."""
+
+	for prev in range(12):
+		for source in range(12):
+			for target in range(12):
+				base = subsequence.harmonic_state._nir_score(prev, source, target, 0, 1.0)
+				for shift in (1, 5, 11):
+					shifted = subsequence.harmonic_state._nir_score(
+						(prev + shift) % 12, (source + shift) % 12, (target + shift) % 12, shift, 1.0
+					)
+					assert shifted == base
+
+
 # --- Root Diversity ---
 
 
-def test_root_diversity_reduces_same_root_frequency () -> None:
+def _suspended_state (seed: int, **kwargs: typing.Any) -> subsequence.harmonic_state.HarmonicState:
 
-	"""The suspended graph at gravity=0.0 should no longer get stuck on one root."""
+	"""A seeded HarmonicState on the suspended graph in C; *kwargs* override the defaults."""
 
-	rng = random.Random(42)
+	options: typing.Dict[str, typing.Any] = {"key_gravity_blend": 0.0, "nir_strength": 0.5}
+	options.update(kwargs)
 
-	hs = subsequence.harmonic_state.HarmonicState(
+	return subsequence.harmonic_state.HarmonicState(
 		key_name = "C",
 		graph_style = "suspended",
-		key_gravity_blend = 0.0,
-		nir_strength = 0.5,
-		rng = rng
+		rng = random.Random(seed),
+		**options
 	)
 
+
+def _top_root_share (roots: typing.List[int]) -> float:
+
+	"""Share of the walk spent on its most common root, from a 12-bin pitch-class histogram."""
+
+	bins = [0] * 12
+
+	for root in roots:
+		bins[root] += 1
+
+	return max(bins) / len(roots)
+
+
+def test_root_diversity_reduces_same_root_frequency () -> None:
+
+	"""The suspended graph at gravity=0.0 should no longer get stuck on one root."""
+
+	hs = _suspended_state(42)
+
 	roots: typing.List[int] = []
 
 	for _ in range(500):
 		chord = hs.step()
 		roots.append(chord.root_pc)
 
-	counts = collections.Counter(roots)
-	top_pct = counts.most_common(1)[0][1] / len(roots)
+	top_pct = _top_root_share(roots)
 
 	# Was 0.63 before the fix; should now stay below 0.50.
 	assert top_pct < 0.50
@@ -240,15 +275,7 @@ def test_root_diversity_does_not_suppress_entirely () -> None:
 
 	"""Even with 4 same-root chords in history, step() should still return a chord."""
 
-	rng = random.Random(99)
-
-	hs = subsequence.harmonic_state.HarmonicState(
-		key_name = "C",
-		graph_style = "suspended",
-		key_gravity_blend = 0.0,
-		nir_strength = 0.5,
-		rng = rng
-	)
+	hs = _suspended_state(99)
 
 	# Fill history with 4 C-root chords.
 	c_sus2 = subsequence.chords.Chord(root_pc=0, quality="sus2")
@@ -266,15 +293,7 @@ def test_root_diversity_counts_root_not_quality () -> None:
 
 	"""History with Csus2 and Csus4 should both count toward the C-root penalty."""
 
-	rng = random.Random(42)
-
-	hs = subsequence.harmonic_state.HarmonicState(
-		key_name = "C",
-		graph_style = "suspended",
-		key_gravity_blend = 1.0,
-		nir_strength = 0.0,
-		rng = rng
-	)
+	hs = _suspended_state(42, key_gravity_blend=1.0, nir_strength=0.0)
 
 	# History: two different qualities on root C.
 	c_sus2 = subsequence.chords.Chord(root_pc=0, quality="sus2")
@@ -304,28 +323,9 @@ def test_root_diversity_disabled_at_one () -> None:
 
 	"""Setting root_diversity=1.0 should disable the penalty entirely."""
 
-	rng_a = random.Random(42)
-	rng_b = random.Random(42)
-
-	# With penalty (default 0.5)
-	hs_with = subsequence.harmonic_state.HarmonicState(
-		key_name = "C",
-		graph_style = "suspended",
-		key_gravity_blend = 0.0,
-		nir_strength = 0.5,
-		root_diversity = 0.5,
-		rng = rng_a
-	)
-
-	# Without penalty (1.0 = disabled)
-	hs_without = subsequence.harmonic_state.HarmonicState(
-		key_name = "C",
-		graph_style = "suspended",
-		key_gravity_blend = 0.0,
-		nir_strength = 0.5,
-		root_diversity = 1.0,
-		rng = rng_b
-	)
+	# With penalty (0.5), and without (1.0 = disabled), from the same seed.
+	hs_with = _suspended_state(42, root_diversity=0.5)
+	hs_without = _suspended_state(42, root_diversity=1.0)
 
 	roots_with: typing.List[int] = []
 	roots_without: typing.List[int] = []
@@ -334,13 +334,25 @@ def test_root_diversity_disabled_at_one () -> None:
 		roots_with.append(hs_with.step().root_pc)
 		roots_without.append(hs_without.step().root_pc)
 
-	top_with = collections.Counter(roots_with).most_common(1)[0][1] / 200
-	top_without = collections.Counter(roots_without).most_common(1)[0][1] / 200
+	top_with = _top_root_share(roots_with)
+	top_without = _top_root_share(roots_without)
 
 	# Disabled penalty should produce more concentrated distribution.
 	assert top_without > top_with
 
 
+@pytest.mark.parametrize("style", ["suspended", "functional_major", "aeolian_minor"])
+def test_step_n_matches_repeated_step (style: str) -> None:
+
+	"""step_n() draws exactly as the same number of step() calls."""
+
+	batched = subsequence.harmonic_state.HarmonicState(key_name="C", graph_style=style, rng=random.Random(7))
+	stepped = subsequence.harmonic_state.HarmonicState(key_name="C", graph_style=style, rng=random.Random(7))
+
+	assert batched.step_n(300) == [stepped.step() for _ in range(300)]
+	assert batched.history == stepped.history
+
+
 def test_step_scoring_sees_distinct_previous_chord () -> None:
 
 	"""During step(), the NIR scorer must compare against the chord BEFORE the
@@ -42,6 +42,18 @@ def test_diatonic_chords_minor_alias () -> None:
 	assert subsequence.harmony.diatonic_chords("A", "minor") == subsequence.harmony.diatonic_chords("A", "aeolian")
 
 
+def test_diatonic_chords_returns_callers_own_list () -> None:
+
+	"""Editing a returned list does not leak into later calls (results are memoised)."""
+
+	chords = subsequence.harmony.diatonic_chords("D", "dorian")
+	chords.reverse()
+	chords.pop()
+
+	assert len(subsequence.harmony.diatonic_chords("D", "dorian")) == 7
+	assert subsequence.harmony.diatonic_chords("D", "dorian")[0] == subsequence.chords.Chord(root_pc=2, quality="minor")
+
+
 def test_diatonic_chords_a_minor () -> None:
 
 	"""A Aeolian should produce natural minor triads."""
@@ -192,11 +204,8 @@ def test_dominant_7th_included () -> None:
 	dominant = subsequence.chords.Chord(root_pc=11, quality="major")
 	dominant_7th = subsequence.chords.Chord(root_pc=11, quality="dominant_7th")
 
-	transitions = graph.get_transitions(dominant)
-	assert any(chord == dominant_7th for chord, _ in transitions)
-
-	transitions_7th = graph.get_transitions(dominant_7th)
-	assert any(chord == tonic for chord, _ in transitions_7th)
+	assert graph.get_weight(dominant, dominant_7th) > 0
+	assert graph.get_weight(dominant_7th, tonic) > 0
 
 
 def test_invalid_key_name () -> None:
@@ -238,3 +247,36 @@ def test_key_gravity_blend_changes_weights () -> None:
 		functional_state._transition_weight(source, target_function, 10)
 		== pytest.approx(diatonic_state._transition_weight(source, target_function, 10))
 	)
+
+
+def test_key_gravity_blend_change_after_construction_is_seen () -> None:
+
+	"""Reassigning key_gravity_blend on a live state re-weights transitions immediately."""
+
+	diatonic, function_chords = subsequence.chord_graphs.functional_major.DiatonicMajor().gravity_sets("E")
+	target_diatonic = next(iter(chord for chord in diatonic if chord not in function_chords))
+
+	state = subsequence.harmonic_state.HarmonicState(key_name="E", key_gravity_blend=0.0)
+	reference = subsequence.harmonic_state.HarmonicState(key_name="E", key_gravity_blend=1.0)
+	source = state.current_chord
+
+	flat = state._transition_weight(source, target_diatonic, 10)
+	state.key_gravity_blend = 1.0
+
+	assert state._transition_weight(source, target_diatonic, 10) == reference._transition_weight(source, target_diatonic, 10)
+	assert state._transition_weight(source, target_diatonic, 10) > flat
+
+
+def test_harmonic_states_do_not_share_graphs () -> None:
+
+	"""States built from the same style get separate graphs, so editing one leaves the other alone."""
+
+	first = subsequence.harmonic_state.HarmonicState(key_name="G")
+	second = subsequence.harmonic_state.HarmonicState(key_name="G")
+
+	extra = subsequence.chords.Chord(root_pc=1, quality="major")
+	first.graph.add_transition(first.current_chord, extra, 100)
+
+	assert first.graph is not second.graph
+	assert second.graph.get_weight(second.current_chord, extra) == 0
+	assert first.current_chord == second.current_chord
@@ -3,6 +3,7 @@ import time
 import typing
 
 import mido
+import pytest
 
 import subsequence
 import subsequence.held_notes
@@ -218,8 +219,5 @@ def test_note_input_second_call_raises (patch_midi: None) -> None:
 	"""v1 supports a single note_input source — a second call is rejected."""
 	comp = subsequence.Composition(bpm=120)
 	comp.note_input()
-	try:
+	with pytest.raises(RuntimeError, match="one note_input source"):
 		comp.note_input()
-		assert False, "expected RuntimeError"
-	except RuntimeError as exc:
-		assert "one note_input source" in str(exc)
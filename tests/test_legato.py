@@ -1,16 +1,32 @@
 
+import typing
+
+import pytest
+
 import subsequence.pattern
 import subsequence.pattern_builder
 
 
-def test_legato_uniform_gap () -> None:
+PatternAndBuilder = typing.Tuple[subsequence.pattern.Pattern, subsequence.pattern_builder.PatternBuilder]
 
-	"""Test legato transform with uniform note spacing."""
 
-	# 4-beat pattern (96 pulses)
+@pytest.fixture
+def pattern_and_builder () -> PatternAndBuilder:
+
+	"""A fresh 4-beat pattern (96 pulses) and a builder writing into it."""
+
 	pat = subsequence.pattern.Pattern(channel=0, length=4.0)
 	builder = subsequence.pattern_builder.PatternBuilder(pattern=pat, cycle=0)
 
+	return pat, builder
+
+
+def test_legato_uniform_gap (pattern_and_builder: PatternAndBuilder) -> None:
+
+	"""Test legato transform with uniform note spacing."""
+
+	pat, builder = pattern_and_builder
+
 	# Notes at beat 0 and 2 (pulses 0 and 48)
 	builder.note(pitch=60, beat=0.0, duration=0.1)
 	builder.note(pitch=62, beat=2.0, duration=0.1)
@@ -24,13 +40,11 @@ def test_legato_uniform_gap () -> None:
 	assert pat.steps[48].notes[0].duration == 48
 
 
-def test_legato_varying_gaps () -> None:
+def test_legato_varying_gaps (pattern_and_builder: PatternAndBuilder) -> None:
 
 	"""Test legato transform with irregular spacing."""
 
-	# 4-beat pattern (96 pulses)
-	pat = subsequence.pattern.Pattern(channel=0, length=4.0)
-	builder = subsequence.pattern_builder.PatternBuilder(pattern=pat, cycle=0)
+	pat, builder = pattern_and_builder
 
 	# Notes at 0, 1.0 (24), 3.0 (72)
 	builder.note(pitch=60, beat=0.0, duration=0.1)
@@ -47,12 +61,11 @@ def test_legato_varying_gaps () -> None:
 	assert pat.steps[72].notes[0].duration == 24
 
 
-def test_legato_ratio () -> None:
+def test_legato_ratio (pattern_and_builder: PatternAndBuilder) -> None:
 
 	"""Test legato with a ratio < 1.0."""
 
-	pat = subsequence.pattern.Pattern(channel=0, length=4.0)
-	builder = subsequence.pattern_builder.PatternBuilder(pattern=pat, cycle=0)
+	pat, builder = pattern_and_builder
 
 	# Notes at 0 and 2.0 (48)
 	builder.note(pitch=60, beat=0.0, duration=0.1)
@@ -66,12 +79,11 @@ def test_legato_ratio () -> None:
 	assert pat.steps[48].notes[0].duration == 24
 
 
-def test_legato_single_note () -> None:
+def test_legato_single_note (pattern_and_builder: PatternAndBuilder) -> None:
 
 	"""Test legato with a single note (should fill pattern)."""
 
-	pat = subsequence.pattern.Pattern(channel=0, length=4.0)
-	builder = subsequence.pattern_builder.PatternBuilder(pattern=pat, cycle=0)
+	pat, builder = pattern_and_builder
 
 	# Note at beat 1.0 (24)
 	builder.note(pitch=60, beat=1.0, duration=0.1)
@@ -82,23 +94,21 @@ def test_legato_single_note () -> None:
 	assert pat.steps[24].notes[0].duration == 96
 
 
-def test_legato_empty () -> None:
+def test_legato_empty (pattern_and_builder: PatternAndBuilder) -> None:
 
 	"""Test legato on empty pattern (no-op)."""
 
-	pat = subsequence.pattern.Pattern(channel=0, length=4.0)
-	builder = subsequence.pattern_builder.PatternBuilder(pattern=pat, cycle=0)
+	pat, builder = pattern_and_builder
 
 	builder.legato()
 	assert len(pat.steps) == 0
 
 
-def test_legato_minimum_duration () -> None:
+def test_legato_minimum_duration (pattern_and_builder: PatternAndBuilder) -> None:
 
 	"""Ensure duration is at least 1 pulse."""
 
-	pat = subsequence.pattern.Pattern(channel=0, length=4.0)
-	builder = subsequence.pattern_builder.PatternBuilder(pattern=pat, cycle=0)
+	pat, builder = pattern_and_builder
 
 	# Notes at 0 and 0 + epsilon (simulate tight spacing or tiny ratio)
 	# But pulse resolution is integers.
@@ -1,6 +1,8 @@
 import asyncio
 import inspect
+import threading
 import time
+import typing
 
 import pytest
 
@@ -18,22 +20,31 @@ async def _send_recv (reader: asyncio.StreamReader, writer: asyncio.StreamWriter
 
 	"""Send code to the live server and return the response string."""
 
-	writer.write(code.encode("utf-8") + SENTINEL)
+	writer.writelines((code.encode("utf-8"), SENTINEL))
 	await writer.drain()
 
-	chunks: list[bytes] = []
+	data = await asyncio.wait_for(reader.readuntil(SENTINEL), timeout=5.0)
 
-	while True:
-		chunk = await asyncio.wait_for(reader.read(4096), timeout=5.0)
+	return data[:-len(SENTINEL)].decode("utf-8")
 
-		if SENTINEL in chunk:
-			before, _, _ = chunk.partition(SENTINEL)
-			chunks.append(before)
-			break
 
-		chunks.append(chunk)
+def _start_pattern (comp: subsequence.Composition, fn: typing.Callable, channel: int = 1) -> subsequence.pattern.Pattern:
 
-	return b"".join(chunks).decode("utf-8")
+	"""Build a 4-beat pattern from a builder function and register it as running under the function's name."""
+
+	pending = subsequence.composition._PendingPattern(
+		builder_fn = fn,
+		channel = channel,
+		length = 4,
+		drum_note_map = None,
+		reschedule_lookahead = 1,
+		default_grid = 16
+	)
+
+	pattern = comp._build_pattern_from_pending(pending)
+	comp._running_patterns[fn.__name__] = pattern
+
+	return pattern
 
 
 @pytest.fixture
@@ -90,6 +101,28 @@ async def test_exec_statement (composition: subsequence.Composition) -> None:
 	await server.stop()
 
 
+@pytest.mark.asyncio
+async def test_message_longer_than_stream_limit (composition: subsequence.Composition) -> None:
+
+	"""A message larger than the stream buffer limit should still arrive whole."""
+
+	server = subsequence.live_server.LiveServer(composition, port=0)
+	await server.start()
+	port = server._server.sockets[0].getsockname()[1]
+
+	reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+	result = await _send_recv(reader, writer, "x = '" + "a" * 200_000 + "'")
+	assert result == "OK"
+
+	result = await _send_recv(reader, writer, "len(x)")
+	assert result == "200000"
+
+	writer.close()
+	await writer.wait_closed()
+	await server.stop()
+
+
 @pytest.mark.asyncio
 async def test_syntax_error_rejected (composition: subsequence.Composition) -> None:
 
@@ -258,19 +291,7 @@ def test_mute_unmute (patch_midi: None) -> None:
 	def my_builder (p: "subsequence.pattern_builder.PatternBuilder") -> None:
 		p.note(60, beat=0, velocity=100)
 
-	pending = subsequence.composition._PendingPattern(
-		builder_fn = my_builder,
-		channel = 1,
-		length = 4,
-		drum_note_map = None,
-		reschedule_lookahead = 1,
-		default_grid = 16
-	)
-
-	pattern = comp._build_pattern_from_pending(pending)
-
-	# Register it as a running pattern.
-	comp._running_patterns["my_builder"] = pattern
+	pattern = _start_pattern(comp, my_builder)
 
 	assert len(pattern.steps) > 0
 
@@ -322,17 +343,7 @@ def test_mute_preserves_cycle_count (patch_midi: None) -> None:
 	def my_builder (p: "subsequence.pattern_builder.PatternBuilder") -> None:
 		p.note(60, beat=0, velocity=100)
 
-	pending = subsequence.composition._PendingPattern(
-		builder_fn = my_builder,
-		channel = 1,
-		length = 4,
-		drum_note_map = None,
-		reschedule_lookahead = 1,
-		default_grid = 16
-	)
-
-	pattern = comp._build_pattern_from_pending(pending)
-	comp._running_patterns["my_builder"] = pattern
+	pattern = _start_pattern(comp, my_builder)
 
 	# cycle_count starts at 1 (incremented in first _rebuild).
 	initial_cycle = pattern._cycle_count
@@ -357,17 +368,7 @@ def test_pattern_hot_swap (patch_midi: None) -> None:
 	def my_pattern (p: "subsequence.pattern_builder.PatternBuilder") -> None:
 		p.note(60, beat=0, velocity=100)
 
-	pending = subsequence.composition._PendingPattern(
-		builder_fn = my_pattern,
-		channel = 1,
-		length = 4,
-		drum_note_map = None,
-		reschedule_lookahead = 1,
-		default_grid = 16
-	)
-
-	pattern = comp._build_pattern_from_pending(pending)
-	comp._running_patterns["my_pattern"] = pattern
+	pattern = _start_pattern(comp, my_pattern)
 	comp._is_live = True
 
 	# Original builder places a note at beat 0.
@@ -397,17 +398,7 @@ def test_hot_swap_updates_wants_chord (patch_midi: None) -> None:
 	def my_pattern (p: "subsequence.pattern_builder.PatternBuilder") -> None:
 		p.note(60, beat=0, velocity=100)
 
-	pending = subsequence.composition._PendingPattern(
-		builder_fn = my_pattern,
-		channel = 1,
-		length = 4,
-		drum_note_map = None,
-		reschedule_lookahead = 1,
-		default_grid = 16
-	)
-
-	pattern = comp._build_pattern_from_pending(pending)
-	comp._running_patterns["my_pattern"] = pattern
+	pattern = _start_pattern(comp, my_pattern)
 	comp._is_live = True
 
 	assert pattern._wants_chord is False
@@ -432,17 +423,7 @@ def test_live_info_includes_patterns (patch_midi: None) -> None:
 	def drums (p: "subsequence.pattern_builder.PatternBuilder") -> None:
 		p.note(36, beat=0, velocity=127)
 
-	pending = subsequence.composition._PendingPattern(
-		builder_fn = drums,
-		channel = 9,
-		length = 4,
-		drum_note_map = None,
-		reschedule_lookahead = 1,
-		default_grid = 16
-	)
-
-	pattern = comp._build_pattern_from_pending(pending)
-	comp._running_patterns["drums"] = pattern
+	pattern = _start_pattern(comp, drums, channel=9)
 
 	info = comp.live_info()
 
@@ -467,8 +448,15 @@ async def test_blocked_builtins (composition: subsequence.Composition) -> None:
 
 	reader, writer = await asyncio.open_connection("127.0.0.1", port)
 
-	for name in ("help()", "input()", "exit()", "quit()", "breakpoint()"):
-		result = await _send_recv(reader, writer, name)
+	names = ("help()", "input()", "exit()", "quit()", "breakpoint()")
+
+	# Pipeline all five messages, then read the five responses in order.
+	writer.writelines(part for name in names for part in (name.encode("utf-8"), SENTINEL))
+	await writer.drain()
+
+	for name in names:
+		data = await asyncio.wait_for(reader.readuntil(SENTINEL), timeout=5.0)
+		result = data[:-len(SENTINEL)].decode("utf-8")
 		assert "RuntimeError" in result, f"{name} should raise RuntimeError, got: {result}"
 		assert "not available in live mode" in result
 
@@ -510,16 +498,22 @@ async def test_eval_does_not_block_event_loop (composition: subsequence.Composit
 	await server.start()
 	port = server._server.sockets[0].getsockname()[1]
 
+	# The slow eval blocks its worker thread until the test releases it, so the
+	# fast eval below is guaranteed to overlap it without a fixed sleep.
+	started = threading.Event()
+	release = threading.Event()
+	server._namespace["started"] = started
+	server._namespace["release"] = release
+
 	# Open two connections - one sends a slow eval, the other pings.
 	slow_reader, slow_writer = await asyncio.open_connection("127.0.0.1", port)
 	fast_reader, fast_writer = await asyncio.open_connection("127.0.0.1", port)
 
-	# Send a slow eval (0.5s sleep) on the first connection.
-	slow_writer.write(b"__import__('time').sleep(0.5)\x04")
+	slow_writer.writelines((b"started.set(); release.wait(5)", SENTINEL))
 	await slow_writer.drain()
 
-	# Give the slow eval a moment to start, then send a fast eval on the second connection.
-	await asyncio.sleep(0.05)
+	# Wait (off the event loop) until the slow eval is actually running.
+	assert await asyncio.to_thread(started.wait, 5)
 
 	start = time.perf_counter()
 	fast_result = await _send_recv(fast_reader, fast_writer, "1 + 1")
@@ -527,18 +521,13 @@ async def test_eval_does_not_block_event_loop (composition: subsequence.Composit
 
 	assert fast_result == "2"
 
-	# The fast eval should complete well before the 0.5s sleep finishes.
+	# The fast eval should complete promptly while the slow eval is still blocked.
 	assert fast_duration < 0.3, f"Fast eval took {fast_duration:.2f}s - event loop was blocked"
 
-	# Wait for the slow eval to finish.
-	slow_chunks: list[bytes] = []
-	while True:
-		chunk = await asyncio.wait_for(slow_reader.read(4096), timeout=5.0)
-		if SENTINEL in chunk:
-			before, _, _ = chunk.partition(SENTINEL)
-			slow_chunks.append(before)
-			break
-		slow_chunks.append(chunk)
+	# Release the slow eval and wait for it to finish.
+	release.set()
+	slow_result = await asyncio.wait_for(slow_reader.readuntil(SENTINEL), timeout=5.0)
+	assert slow_result == b"OK" + SENTINEL
 
 	slow_writer.close()
 	await slow_writer.wait_closed()
@@ -9,6 +9,7 @@ Covers:
 - Range gravity
 - Pitch diversity penalty
 - Full-range distribution (notes within bounds)
+- _score_pool() agreeing with per-candidate scoring
 """
 
 import random
@@ -202,6 +203,17 @@ class TestChooseNext:
 		assert _run(42) == _run(42)
 		assert _run(42) != _run(99)
 
+	def test_zero_scored_candidates_never_chosen (self) -> None:
+		"""Only candidates with a positive score can be drawn."""
+		ms = _state()
+		allowed = {ms._pitch_pool[0], ms._pitch_pool[3], ms._pitch_pool[-1]}
+		ms.factors.append(lambda state, ctx: 1.0 if ctx.candidate in allowed else 0.0)
+		rng = random.Random(3)
+
+		chosen = {ms.choose_next(chord_tones=None, rng=rng) for _ in range(200)}
+
+		assert chosen == allowed
+
 	def test_history_grows_and_caps_at_four (self) -> None:
 		"""History should grow up to 4 entries then stay at 4."""
 		ms = _state(rest_probability=0.0)
@@ -415,3 +427,48 @@ class TestRangeGravity:
 		score_edge = ms._score_candidate(edge_pitch, set())
 
 		assert score_centre > score_edge
+
+
+# ---------------------------------------------------------------------------
+# _score_pool — whole-pool scoring
+# ---------------------------------------------------------------------------
+
+class TestScorePool:
+
+	def test_matches_per_candidate_scores (self) -> None:
+		"""Scoring the whole pool should agree with scoring each candidate alone."""
+		ms = _state(low=48, high=84, chord_weight=0.4, pitch_diversity=0.6)
+		ms.history = [60, 67, 65]
+
+		seen: list = []
+
+		def spy (state: subsequence.melodic_state.MelodicState, ctx: subsequence.melodic_state.ScoringContext) -> float:
+			seen.append(ctx)
+			return 1.0 + ctx.beat
+
+		ms.factors.append(spy)
+
+		scores = ms._score_pool(frozenset({0, 4, 7}), beat=1.5, position=0.25, contour_target=0.5)
+
+		assert scores == [
+			pytest.approx(ms._score_candidate(p, {0, 4, 7}, beat=1.5, position=0.25, contour_target=0.5))
+			for p in ms._pitch_pool
+		]
+
+		# Each candidate gets its own complete, still-immutable context.
+		pool_contexts = seen[:len(ms._pitch_pool)]
+		assert tuple(ctx.candidate for ctx in pool_contexts) == ms._pitch_pool
+		assert pool_contexts[0] == subsequence.melodic_state.ScoringContext(
+			candidate = ms._pitch_pool[0],
+			history = (60, 67, 65),
+			chord_tone_pcs = frozenset({0, 4, 7}),
+			tonic_pc = 0,
+			low = 48,
+			high = 84,
+			beat = 1.5,
+			position = 0.25,
+			contour_target = 0.5,
+		)
+
+		with pytest.raises(AttributeError):
+			pool_contexts[0].candidate = 0
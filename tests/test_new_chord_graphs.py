@@ -1,6 +1,9 @@
 """Tests for chord graph styles."""
 
+import collections
+import functools
 import random
+import typing
 
 import pytest
 
@@ -14,35 +17,41 @@ import subsequence.chord_graphs.suspended
 import subsequence.chord_graphs.whole_tone
 import subsequence.chords
 import subsequence.harmonic_state
+import subsequence.weighted_graph
 
 
 # ---- Helpers ----
 
-def _assert_no_dead_ends (graph_obj: subsequence.chord_graphs.ChordGraph, key: str) -> int:
-
-	"""BFS from tonic - every reachable chord must have outgoing transitions. Returns node count."""
+def _reachable (graph: subsequence.weighted_graph.WeightedGraph, tonic: subsequence.chords.Chord) -> typing.Set[subsequence.chords.Chord]:
 
-	graph, tonic = graph_obj.build(key)
+	"""Breadth-first walk from the tonic - every chord reachable through the graph's transitions."""
 
-	visited = set()
-	queue = [tonic]
+	# Mark chords as seen when they are queued, so each is queued at most once.
+	visited = {tonic}
+	queue = collections.deque([tonic])
 
 	while queue:
-		current = queue.pop(0)
+		current = queue.popleft()
 
-		if current in visited:
-			continue
+		for target, _ in graph.get_transitions(current):
+
+			if target not in visited:
+				visited.add(target)
+				queue.append(target)
 
-		visited.add(current)
+	return visited
 
-		transitions = graph.get_transitions(current)
 
-		assert len(transitions) > 0, f"Dead end: {current} has no outgoing transitions"
+def _assert_no_dead_ends (graph_obj: subsequence.chord_graphs.ChordGraph, key: str) -> int:
 
-		for target, _ in transitions:
+	"""Every chord reachable from the tonic must have outgoing transitions. Returns node count."""
 
-			if target not in visited:
-				queue.append(target)
+	graph, tonic = graph_obj.build(key)
+
+	visited = _reachable(graph, tonic)
+
+	for current in visited:
+		assert len(graph.get_transitions(current)) > 0, f"Dead end: {current} has no outgoing transitions"
 
 	return len(visited)
 
@@ -64,6 +73,54 @@ def _assert_stepping_stable (style: str, key: str = "C", steps: int = 50) -> Non
 		state.step()
 
 
+# ===========================================================================
+# All styles
+# ===========================================================================
+
+# (style name, graph factory, key, tonic quality, steps for the stability walk)
+_STYLES = [
+	("lydian_major", functools.partial(subsequence.chord_graphs.lydian_major.LydianMajor, include_dominant_7th=True), "C", "major", 50),
+	("dorian_minor", functools.partial(subsequence.chord_graphs.dorian_minor.DorianMinor, include_dominant_7th=True), "D", "minor", 50),
+	("chromatic_mediant", subsequence.chord_graphs.chromatic_mediant.ChromaticMediant, "C", "major", 50),
+	("suspended", subsequence.chord_graphs.suspended.Suspended, "A", "sus2", 50),
+	("mixolydian", subsequence.chord_graphs.mixolydian.Mixolydian, "C", "major", 100),
+	("whole_tone", subsequence.chord_graphs.whole_tone.WholeTone, "C", "augmented", 100),
+	("diminished", subsequence.chord_graphs.diminished.Diminished, "C", "diminished", 100),
+]
+
+_STYLE_PARAMS = pytest.mark.parametrize(
+	("style", "make_graph", "key", "tonic_quality", "steps"),
+	_STYLES,
+	ids = [row[0] for row in _STYLES]
+)
+
+
+@_STYLE_PARAMS
+def test_no_dead_ends (style: str, make_graph: typing.Callable[[], subsequence.chord_graphs.ChordGraph], key: str, tonic_quality: str, steps: int) -> None:
+
+	"""Every chord reachable in the graph should have outgoing transitions."""
+
+	_assert_no_dead_ends(make_graph(), key)
+
+
+@_STYLE_PARAMS
+def test_string_name (style: str, make_graph: typing.Callable[[], subsequence.chord_graphs.ChordGraph], key: str, tonic_quality: str, steps: int) -> None:
+
+	"""HarmonicState should accept the style's name as a graph_style string."""
+
+	state = subsequence.harmonic_state.HarmonicState(key_name=key, graph_style=style)
+
+	assert state.current_chord.quality == tonic_quality
+
+
+@_STYLE_PARAMS
+def test_stepping_stable (style: str, make_graph: typing.Callable[[], subsequence.chord_graphs.ChordGraph], key: str, tonic_quality: str, steps: int) -> None:
+
+	"""Stepping many times should not raise any errors."""
+
+	_assert_stepping_stable(style, key=key, steps=steps)
+
+
 # ===========================================================================
 # Lydian Major
 # ===========================================================================
@@ -103,31 +160,7 @@ class TestLydianMajor:
 
 		natural_iv = subsequence.chords.Chord(root_pc=5, quality="major")
 
-		# Walk all reachable chords.
-		visited = set()
-		queue = [tonic]
-
-		while queue:
-			current = queue.pop(0)
-
-			if current in visited:
-				continue
-
-			visited.add(current)
-
-			assert current != natural_iv, "Natural IV should not appear in a Lydian graph"
-
-			for target, _ in graph.get_transitions(current):
-
-				if target not in visited:
-					queue.append(target)
-
-	def test_no_dead_ends (self) -> None:
-
-		"""Every chord reachable in the graph should have outgoing transitions."""
-
-		graph_obj = subsequence.chord_graphs.lydian_major.LydianMajor(include_dominant_7th=True)
-		_assert_no_dead_ends(graph_obj, "C")
+		assert natural_iv not in _reachable(graph, tonic), "Natural IV should not appear in a Lydian graph"
 
 	def test_gravity_sets (self) -> None:
 
@@ -146,20 +179,6 @@ class TestLydianMajor:
 
 		assert supertonic in functional
 
-	def test_string_name (self) -> None:
-
-		"""HarmonicState should accept 'lydian_major' as a style string."""
-
-		state = subsequence.harmonic_state.HarmonicState(key_name="C", graph_style="lydian_major")
-
-		assert state.current_chord.quality == "major"
-
-	def test_stepping_stable (self) -> None:
-
-		"""Stepping 50 times should not raise any errors."""
-
-		_assert_stepping_stable("lydian_major")
-
 
 # ===========================================================================
 # Dorian Minor
@@ -191,13 +210,6 @@ class TestDorianMinor:
 
 		assert any(chord == tonic for chord, _ in transitions)
 
-	def test_no_dead_ends (self) -> None:
-
-		"""Every chord reachable in the graph should have outgoing transitions."""
-
-		graph_obj = subsequence.chord_graphs.dorian_minor.DorianMinor(include_dominant_7th=True)
-		_assert_no_dead_ends(graph_obj, "D")
-
 	def test_gravity_sets (self) -> None:
 
 		"""Tonic should be in both sets. IV (major) should be in functional."""
@@ -215,20 +227,6 @@ class TestDorianMinor:
 
 		assert subdominant in functional
 
-	def test_string_name (self) -> None:
-
-		"""HarmonicState should accept 'dorian_minor' as a style string."""
-
-		state = subsequence.harmonic_state.HarmonicState(key_name="D", graph_style="dorian_minor")
-
-		assert state.current_chord.quality == "minor"
-
-	def test_stepping_stable (self) -> None:
-
-		"""Stepping 50 times should not raise any errors."""
-
-		_assert_stepping_stable("dorian_minor", key="D")
-
 
 # ===========================================================================
 # Chromatic Mediant
@@ -260,13 +258,6 @@ class TestChromaticMediant:
 
 		assert any(chord == tonic for chord, _ in transitions)
 
-	def test_no_dead_ends (self) -> None:
-
-		"""Every chord reachable in the graph should have outgoing transitions."""
-
-		graph_obj = subsequence.chord_graphs.chromatic_mediant.ChromaticMediant()
-		_assert_no_dead_ends(graph_obj, "C")
-
 	def test_gravity_sets (self) -> None:
 
 		"""Tonic and bIII should be in the functional set."""
@@ -283,20 +274,6 @@ class TestChromaticMediant:
 
 		assert flat_mediant in functional
 
-	def test_string_name (self) -> None:
-
-		"""HarmonicState should accept 'chromatic_mediant' as a style string."""
-
-		state = subsequence.harmonic_state.HarmonicState(key_name="C", graph_style="chromatic_mediant")
-
-		assert state.current_chord.quality == "major"
-
-	def test_stepping_stable (self) -> None:
-
-		"""Stepping 50 times should not raise any errors."""
-
-		_assert_stepping_stable("chromatic_mediant")
-
 
 # ===========================================================================
 # Suspended
@@ -345,31 +322,7 @@ class TestSuspended:
 
 		tonic_minor = subsequence.chords.Chord(root_pc=9, quality="minor")
 
-		# Walk all reachable chords and check that tonic_minor is reachable.
-		visited = set()
-		queue = [tonic]
-
-		while queue:
-			current = queue.pop(0)
-
-			if current in visited:
-				continue
-
-			visited.add(current)
-
-			for target, _ in graph.get_transitions(current):
-
-				if target not in visited:
-					queue.append(target)
-
-		assert tonic_minor in visited, "Minor tonic should be reachable from the graph"
-
-	def test_no_dead_ends (self) -> None:
-
-		"""Every chord reachable in the graph should have outgoing transitions."""
-
-		graph_obj = subsequence.chord_graphs.suspended.Suspended()
-		_assert_no_dead_ends(graph_obj, "A")
+		assert tonic_minor in _reachable(graph, tonic), "Minor tonic should be reachable from the graph"
 
 	def test_gravity_sets (self) -> None:
 
@@ -390,20 +343,6 @@ class TestSuspended:
 		assert tonic_sus4 in diatonic
 		assert tonic_minor in diatonic
 
-	def test_string_name (self) -> None:
-
-		"""HarmonicState should accept 'suspended' as a style string."""
-
-		state = subsequence.harmonic_state.HarmonicState(key_name="A", graph_style="suspended")
-
-		assert state.current_chord.quality == "sus2"
-
-	def test_stepping_stable (self) -> None:
-
-		"""Stepping 50 times should not raise any errors."""
-
-		_assert_stepping_stable("suspended", key="A")
-
 
 # ===========================================================================
 # Mixolydian
@@ -442,33 +381,10 @@ class TestMixolydian:
 		graph_obj = subsequence.chord_graphs.mixolydian.Mixolydian()
 		graph, tonic = graph_obj.build("C")
 
-		# Walk all reachable chords - G major (root_pc=7) should not appear.
+		# G major (root_pc=7) should not be reachable.
 		dominant_major = subsequence.chords.Chord(root_pc=7, quality="major")
 
-		visited = set()
-		queue = [tonic]
-
-		while queue:
-			current = queue.pop(0)
-
-			if current in visited:
-				continue
-
-			visited.add(current)
-
-			assert current != dominant_major, "V major should not appear in a Mixolydian graph"
-
-			for target, _ in graph.get_transitions(current):
-
-				if target not in visited:
-					queue.append(target)
-
-	def test_no_dead_ends (self) -> None:
-
-		"""Every chord reachable in the graph should have outgoing transitions."""
-
-		graph_obj = subsequence.chord_graphs.mixolydian.Mixolydian()
-		_assert_no_dead_ends(graph_obj, "C")
+		assert dominant_major not in _reachable(graph, tonic), "V major should not appear in a Mixolydian graph"
 
 	def test_gravity_sets (self) -> None:
 
@@ -487,20 +403,6 @@ class TestMixolydian:
 		assert subdominant in functional
 		assert flat_seven in functional
 
-	def test_string_name (self) -> None:
-
-		"""HarmonicState should accept 'mixolydian' as a style string."""
-
-		state = subsequence.harmonic_state.HarmonicState(key_name="C", graph_style="mixolydian")
-
-		assert state.current_chord.quality == "major"
-
-	def test_stepping_stable (self) -> None:
-
-		"""Stepping 100 times should not raise any errors."""
-
-		_assert_stepping_stable("mixolydian", steps=100)
-
 
 # ===========================================================================
 # Whole Tone
@@ -515,23 +417,8 @@ class TestWholeTone:
 		graph_obj = subsequence.chord_graphs.whole_tone.WholeTone()
 		graph, tonic = graph_obj.build("C")
 
-		visited = set()
-		queue = [tonic]
-
-		while queue:
-			current = queue.pop(0)
-
-			if current in visited:
-				continue
-
-			visited.add(current)
-
-			assert current.quality == "augmented", f"Expected augmented, got {current.quality}"
-
-			for target, _ in graph.get_transitions(current):
-
-				if target not in visited:
-					queue.append(target)
+		for chord in _reachable(graph, tonic):
+			assert chord.quality == "augmented", f"Expected augmented, got {chord.quality}"
 
 	def test_six_chords (self) -> None:
 
@@ -549,33 +436,10 @@ class TestWholeTone:
 		graph_obj = subsequence.chord_graphs.whole_tone.WholeTone()
 		graph, tonic = graph_obj.build("C")
 
-		visited = set()
-		queue = [tonic]
-
-		while queue:
-			current = queue.pop(0)
-
-			if current in visited:
-				continue
-
-			visited.add(current)
-
-			transitions = graph.get_transitions(current)
-
+		for chord in _reachable(graph, tonic):
+			transitions = graph.get_transitions(chord)
 			assert len(transitions) == 5, f"Expected 5 transitions, got {len(transitions)}"
 
-			for target, _ in transitions:
-
-				if target not in visited:
-					queue.append(target)
-
-	def test_no_dead_ends (self) -> None:
-
-		"""Every chord reachable in the graph should have outgoing transitions."""
-
-		graph_obj = subsequence.chord_graphs.whole_tone.WholeTone()
-		_assert_no_dead_ends(graph_obj, "C")
-
 	def test_gravity_sets (self) -> None:
 
 		"""Diatonic set should have 6 chords. Functional should have 1 (tonic only)."""
@@ -591,20 +455,6 @@ class TestWholeTone:
 		assert tonic in diatonic
 		assert tonic in functional
 
-	def test_string_name (self) -> None:
-
-		"""HarmonicState should accept 'whole_tone' as a style string."""
-
-		state = subsequence.harmonic_state.HarmonicState(key_name="C", graph_style="whole_tone")
-
-		assert state.current_chord.quality == "augmented"
-
-	def test_stepping_stable (self) -> None:
-
-		"""Stepping 100 times should not raise any errors."""
-
-		_assert_stepping_stable("whole_tone", steps=100)
-
 
 # ===========================================================================
 # Diminished
@@ -619,21 +469,7 @@ class TestDiminished:
 		graph_obj = subsequence.chord_graphs.diminished.Diminished()
 		graph, tonic = graph_obj.build("C")
 
-		visited = set()
-		queue = [tonic]
-
-		while queue:
-			current = queue.pop(0)
-
-			if current in visited:
-				continue
-
-			visited.add(current)
-
-			for target, _ in graph.get_transitions(current):
-
-				if target not in visited:
-					queue.append(target)
+		visited = _reachable(graph, tonic)
 
 		dim_count = sum(1 for c in visited if c.quality == "diminished")
 
@@ -646,21 +482,7 @@ class TestDiminished:
 		graph_obj = subsequence.chord_graphs.diminished.Diminished()
 		graph, tonic = graph_obj.build("C")
 
-		visited = set()
-		queue = [tonic]
-
-		while queue:
-			current = queue.pop(0)
-
-			if current in visited:
-				continue
-
-			visited.add(current)
-
-			for target, _ in graph.get_transitions(current):
-
-				if target not in visited:
-					queue.append(target)
+		visited = _reachable(graph, tonic)
 
 		dom_count = sum(1 for c in visited if c.quality == "dominant_7th")
 
@@ -671,40 +493,17 @@ class TestDiminished:
 		"""Diminished chord roots should be 3 semitones apart (minor third symmetry)."""
 
 		graph_obj = subsequence.chord_graphs.diminished.Diminished()
-		_, tonic = graph_obj.build("C")
+		graph, tonic = graph_obj.build("C")
 
 		# In key of C, diminished roots should be 0, 3, 6, 9.
 		expected_roots = {0, 3, 6, 9}
 
-		graph, _ = graph_obj.build("C")
-
-		visited = set()
-		queue = [tonic]
-
-		while queue:
-			current = queue.pop(0)
-
-			if current in visited:
-				continue
-
-			visited.add(current)
-
-			for target, _ in graph.get_transitions(current):
-
-				if target not in visited:
-					queue.append(target)
+		visited = _reachable(graph, tonic)
 
 		dim_roots = {c.root_pc for c in visited if c.quality == "diminished"}
 
 		assert dim_roots == expected_roots
 
-	def test_no_dead_ends (self) -> None:
-
-		"""Every chord reachable in the graph should have outgoing transitions."""
-
-		graph_obj = subsequence.chord_graphs.diminished.Diminished()
-		_assert_no_dead_ends(graph_obj, "C")
-
 	def test_gravity_sets (self) -> None:
 
 		"""Diatonic should have 8 chords. Functional should be the 4 diminished chords."""
@@ -718,17 +517,3 @@ class TestDiminished:
 		# All functional chords should be diminished.
 		for chord in functional:
 			assert chord.quality == "diminished"
-
-	def test_string_name (self) -> None:
-
-		"""HarmonicState should accept 'diminished' as a style string."""
-
-		state = subsequence.harmonic_state.HarmonicState(key_name="C", graph_style="diminished")
-
-		assert state.current_chord.quality == "diminished"
-
-	def test_stepping_stable (self) -> None:
-
-		"""Stepping 100 times should not raise any errors."""
-
-		_assert_stepping_stable("diminished", steps=100)
@@ -19,11 +19,8 @@ def test_turnaround_edges_present () -> None:
 	supertonic = subsequence.chords.Chord(root_pc=2, quality="minor")
 	dominant_7th = subsequence.chords.Chord(root_pc=7, quality="dominant_7th")
 
-	transitions = graph.get_transitions(supertonic)
-	assert any(chord == dominant_7th for chord, _ in transitions)
-
-	transitions_7th = graph.get_transitions(dominant_7th)
-	assert any(chord == tonic for chord, _ in transitions_7th)
+	assert graph.get_weight(supertonic, dominant_7th) > 0
+	assert graph.get_weight(dominant_7th, tonic) > 0
 
 
 def test_minor_turnaround_weight_toggle () -> None:
@@ -72,3 +72,82 @@ def test_choose_next_is_unaffected_by_labels () -> None:
 		labelled.choose_next("a", random.Random(5))
 		== bare.choose_next("a", random.Random(5))
 	)
+
+
+def test_unmodified_pick_matches_modified_path () -> None:
+
+	"""The cached cumulative fast path draws exactly like the general path."""
+
+	graph: subsequence.weighted_graph.WeightedGraph = subsequence.weighted_graph.WeightedGraph()
+	graph.add_transition("a", "b", 3)
+	graph.add_transition("a", "c", 7)
+	graph.add_transition("a", "d", 1)
+
+	fast_rng = random.Random(11)
+	slow_rng = random.Random(11)
+
+	fast = [graph.choose_next("a", fast_rng) for _ in range(200)]
+	slow = [graph.choose_next("a", slow_rng, weight_modifier=lambda s, t, w: 1.0) for _ in range(200)]
+
+	assert fast == slow
+
+
+def test_unmodified_pick_sees_new_transitions () -> None:
+
+	"""Adding a transition after a pick invalidates the cached table."""
+
+	graph: subsequence.weighted_graph.WeightedGraph = subsequence.weighted_graph.WeightedGraph()
+	graph.add_transition("a", "b", 1)
+
+	assert graph.choose_next("a", random.Random(0)) == "b"
+	assert graph.choose_next("z", random.Random(0)) == "z"
+
+	graph.add_transition("a", "c", 1_000_000)
+	picks = {graph.choose_next("a", random.Random(seed)) for seed in range(20)}
+
+	assert "c" in picks
+
+
+def test_cumulative_weights_omits_suppressed_targets () -> None:
+
+	"""Suppressed transitions drop out of the table; an empty table keeps the source."""
+
+	graph: subsequence.weighted_graph.WeightedGraph = subsequence.weighted_graph.WeightedGraph()
+	graph.add_transition("a", "b", 2)
+	graph.add_transition("a", "c", 3)
+
+	table = graph.cumulative_weights("a", lambda s, t, w: 0.0 if t == "b" else 2.0)
+
+	assert table == (["c"], [6.0])
+	assert graph.choose_from_table("a", graph.cumulative_weights("a", lambda s, t, w: 0.0), random.Random(1)) == "a"
+
+
+def test_get_weight_looks_up_one_transition () -> None:
+
+	"""get_weight returns the accumulated edge weight, or 0 for a missing edge or source."""
+
+	graph: subsequence.weighted_graph.WeightedGraph = subsequence.weighted_graph.WeightedGraph()
+	graph.add_transition("a", "b", 2)
+	graph.add_transition("a", "b", 3)
+
+	assert graph.get_weight("a", "b") == 5
+	assert graph.get_weight("a", "c") == 0
+	assert graph.get_weight("z", "b") == 0
+
+
+def test_copy_is_independent () -> None:
+
+	"""A copied graph draws identically but does not share later edits."""
+
+	graph: subsequence.weighted_graph.WeightedGraph = subsequence.weighted_graph.WeightedGraph()
+	graph.add_transition("a", "b", 3, label="step")
+	graph.add_transition("a", "c", 1)
+	graph.choose_next("a", random.Random(0))  # populate the cumulative table
+
+	duplicate = graph.copy()
+	duplicate.add_transition("a", "d", 5)
+
+	assert graph.get_transitions("a") == [("b", 3), ("c", 1)]
+	assert duplicate.get_label("a", "b") == "step"
+	assert graph.choose_next("a", random.Random(4)) in ("b", "c")
+	assert {duplicate.choose_next("a", random.Random(seed)) for seed in range(30)} >= {"d"}